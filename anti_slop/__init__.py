@@ -2,6 +2,7 @@
 from .base import BaseTool, ToolResult
 from .registry import ToolRegistry
 from .enums import ToolName
+from .textdoc import TextDoc
 from .analyzers import (
     AIPhrasesAnalyzer,
     ClicheAnalyzer,
@@ -16,8 +17,8 @@ from .cleaners import (
     RedundancyCleaner,
     EmojiCleaner,
     WhitespaceCleaner,
+    CleaningPipeline,
 )
-from .ai_tools import ContentAnalyzer, ContentImprover
 
 __version__ = "1.0.0"
 
@@ -26,6 +27,7 @@ __all__ = [
     "ToolResult",
     "ToolRegistry",
     "ToolName",
+    "TextDoc",
     "AIPhrasesAnalyzer",
     "ClicheAnalyzer",
     "PassiveVoiceAnalyzer",
@@ -37,6 +39,15 @@ __all__ = [
     "RedundancyCleaner",
     "EmojiCleaner",
     "WhitespaceCleaner",
+    "CleaningPipeline",
     "ContentAnalyzer",
     "ContentImprover",
 ]
+
+
+def __getattr__(name):
+    # The OpenAI-backed tools pull in the openai client, so import them on first use
+    if name in ("ContentAnalyzer", "ContentImprover"):
+        from . import ai_tools
+        return getattr(ai_tools, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,110 +1,241 @@
 """AI-powered analysis and improvement tools."""
+import asyncio
 import json
 import os
-from typing import Optional
-from openai import OpenAI
+from abc import abstractmethod
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple
+from openai import AsyncOpenAI, OpenAI
 from .base import BaseTool, ToolResult
 from .enums import ToolName
 
 
-class ContentAnalyzer(BaseTool):
-    """Analyze content for slop using AI."""
+@lru_cache(maxsize=None)
+def _clients(api_key: str) -> Tuple[OpenAI, AsyncOpenAI]:
+    """Sync and async clients for a key, shared so every tool reuses the same connection pools."""
+    return OpenAI(api_key=api_key), AsyncOpenAI(api_key=api_key)
+
+
+class OpenAITool(BaseTool):
+    """Base class for tools backed by the OpenAI chat completions API.
+
+    Texts are sent in numbered blocks so several of them can share one request;
+    the model answers with a ``results`` array keyed by block index.
+    """
+    
+    MODEL = "gpt-4"
+    TEMPERATURE = 0.3
+    ERROR_MESSAGE = "Failed to process content"
+    CACHE_TTL = 3600
+    # Rough per-request budget (~6k tokens) so a batch never overflows the context
+    MAX_BATCH_CHARS = 24000
+    # Static across calls so the provider can cache it as a prompt prefix
+    SYSTEM_PROMPT: str
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, model: Optional[str] = None):
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
-        self.client = OpenAI(api_key=self.api_key) if self.api_key else None
+        self.model = model or self.MODEL
+        self.client, self.async_client = _clients(self.api_key) if self.api_key else (None, None)
     
-    @property
-    def name(self) -> str:
-        return ToolName.ANALYZE_CONTENT_FOR_SLOP.value
+    @abstractmethod
+    def _user_message(self, blocks: str, **kwargs) -> str:
+        """Build the user message for a set of numbered text blocks."""
+        pass
     
-    @property
-    def description(self) -> str:
-        return "Analyze text for low-quality AI-generated content. Returns a score (0-10) where higher means more slop, plus specific issues and suggestions."
+    @abstractmethod
+    def _to_data(self, item: Dict[str, Any], content: str, **kwargs) -> Dict[str, Any]:
+        """Convert one entry of the model's ``results`` array to tool data."""
+        pass
     
     def execute(self, content: str, **kwargs) -> ToolResult:
+        return self.batch_execute([content], **kwargs)[0]
+    
+    async def aexecute(self, content: str, **kwargs) -> ToolResult:
+        """Async variant of execute() that doesn't block the event loop on the API call."""
+        return (await self.abatch_execute([content], **kwargs))[0]
+    
+    async def execute_stream(self, content: str, **kwargs) -> AsyncIterator[str]:
+        """Stream the model's JSON answer for one text as it is generated.
+
+        Pass the joined chunks to result_from_json() to get the ToolResult.
+        """
+        if not self.async_client:
+            raise RuntimeError("OpenAI API key not configured. Set OPENAI_API_KEY environment variable.")
+        
+        stream = await self.async_client.chat.completions.create(
+            **self._request([content], **kwargs), stream=True
+        )
+        async for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+    
+    def result_from_json(self, content: str, text: str, **kwargs) -> ToolResult:
+        """Build the ToolResult for one text from the model's raw JSON answer."""
+        try:
+            by_index = self._parse(text, 1)
+        except Exception as e:
+            return self._failed([content], e)[0]
+        return self._results([content], by_index, **kwargs)[0]
+    
+    def batch_execute(self, contents: List[str], batch_size: int = 8, **kwargs) -> List[ToolResult]:
+        """Process several texts, packing up to ``batch_size`` into each API call."""
         if not self.client:
-            return ToolResult(
+            return self._not_configured(contents)
+        
+        results = []
+        for batch in self._batches(contents, batch_size):
+            results.extend(self._run_batch(batch, **kwargs))
+        return results
+    
+    async def abatch_execute(self, contents: List[str], batch_size: int = 8, **kwargs) -> List[ToolResult]:
+        """Async variant of batch_execute(); the batches are sent concurrently."""
+        if not self.async_client:
+            return self._not_configured(contents)
+        
+        batches = await asyncio.gather(*(
+            self._arun_batch(batch, **kwargs) for batch in self._batches(contents, batch_size)
+        ))
+        return [result for batch in batches for result in batch]
+    
+    @staticmethod
+    def _not_configured(contents: List[str]) -> List[ToolResult]:
+        return [
+            ToolResult(
                 success=False,
                 data={},
                 error="OpenAI API key not configured. Set OPENAI_API_KEY environment variable."
             )
-        
+            for _ in contents
+        ]
+    
+    def _batches(self, contents: List[str], batch_size: int) -> Iterator[List[str]]:
+        batch = []
+        size = 0
+        for content in contents:
+            if batch and (len(batch) >= batch_size or size + len(content) > self.MAX_BATCH_CHARS):
+                yield batch
+                batch = []
+                size = 0
+            batch.append(content)
+            size += len(content)
+        if batch:
+            yield batch
+    
+    def _messages(self, blocks: str, **kwargs) -> List[Dict[str, str]]:
+        # Everything request-specific goes in the user message so the system
+        # prompt stays a stable, cacheable prefix
+        return [
+            {"role": "system", "content": self.SYSTEM_PROMPT},
+            {"role": "user", "content": self._user_message(blocks, **kwargs)},
+        ]
+    
+    def _request(self, batch: List[str], **kwargs) -> Dict[str, Any]:
+        blocks = "\n".join(f"==={i}===\n{content}" for i, content in enumerate(batch, 1))
+        return {
+            "model": self.model,
+            "messages": self._messages(blocks, **kwargs),
+            "temperature": self.TEMPERATURE,
+            "response_format": {"type": "json_object"},
+        }
+    
+    @staticmethod
+    def _parse(text: str, batch_len: int) -> Dict[str, Dict[str, Any]]:
+        payload = json.loads(text)
+        items = payload.get("results")
+        if items is None and batch_len == 1:
+            # The model answered a single block with a bare object
+            items = [{**payload, "index": 1}]
+        return {str(item.get("index")): item for item in items or []}
+    
+    def _run_batch(self, batch: List[str], **kwargs) -> List[ToolResult]:
         try:
-            completion = self.client.chat.completions.create(
-                model="gpt-4",
-                messages=[
-                    {
-                        "role": "system",
-                        "content": """You are a content quality analyzer. Analyze the given text for "slop" - low-quality, repetitive, generic, or unnecessarily verbose AI-generated content. 
-                        
-Rate the content on a scale of 0-10 where:
+            completion = self.client.chat.completions.create(**self._request(batch, **kwargs))
+            by_index = self._parse(completion.choices[0].message.content, len(batch))
+        except Exception as e:
+            return self._failed(batch, e)
+        return self._results(batch, by_index, **kwargs)
+    
+    async def _arun_batch(self, batch: List[str], **kwargs) -> List[ToolResult]:
+        try:
+            completion = await self.async_client.chat.completions.create(**self._request(batch, **kwargs))
+            by_index = self._parse(completion.choices[0].message.content, len(batch))
+        except Exception as e:
+            return self._failed(batch, e)
+        return self._results(batch, by_index, **kwargs)
+    
+    def _failed(self, batch: List[str], error: Exception) -> List[ToolResult]:
+        return [
+            ToolResult(success=False, data={}, error=f"{self.ERROR_MESSAGE}: {str(error)}")
+            for _ in batch
+        ]
+    
+    def _results(self, batch: List[str], by_index: Dict[str, Dict[str, Any]], **kwargs) -> List[ToolResult]:
+        results = []
+        for i, content in enumerate(batch, 1):
+            item = by_index.get(str(i))
+            if item is None:
+                results.append(ToolResult(
+                    success=False,
+                    data={},
+                    error=f"{self.ERROR_MESSAGE}: no result returned for block {i}"
+                ))
+            else:
+                try:
+                    data = self._to_data(item, content, **kwargs)
+                except Exception as e:
+                    results.extend(self._failed([content], e))
+                else:
+                    results.append(ToolResult(success=True, data=data))
+        return results
+
+
+class ContentAnalyzer(OpenAITool):
+    """Analyze content for slop using AI."""
+    
+    ERROR_MESSAGE = "Failed to analyze content"
+    SYSTEM_PROMPT = """You are a content quality analyzer. Analyze the given text for "slop" - low-quality, repetitive, generic, or unnecessarily verbose AI-generated content.
+
+The text arrives as one or more numbered blocks, each starting with a line like ===1===. Analyze every block independently.
+
+Rate each block on a scale of 0-10 where:
 - 0-3: High quality, concise, specific content
 - 4-6: Moderate quality with some generic phrases
 - 7-10: Low quality "slop" with excessive fluff, repetition, or generic statements
 
-Provide a JSON response with:
+Provide a JSON response with a "results" array holding one object per block with:
+- index (the block number)
 - score (0-10)
 - issues (array of specific problems found)
 - suggestions (array of improvement recommendations)"""
-                    },
-                    {
-                        "role": "user",
-                        "content": f"Analyze this content:\n\n{content}"
-                    }
-                ],
-                temperature=0.3,
-                response_format={"type": "json_object"}
-            )
-            
-            analysis = json.loads(completion.choices[0].message.content)
-            
-            return ToolResult(
-                success=True,
-                data={
-                    "score": analysis.get("score", 0),
-                    "issues": analysis.get("issues", []),
-                    "suggestions": analysis.get("suggestions", []),
-                }
-            )
-        except Exception as e:
-            return ToolResult(
-                success=False,
-                data={},
-                error=f"Failed to analyze content: {str(e)}"
-            )
-
-
-class ContentImprover(BaseTool):
-    """Improve content by removing slop using AI."""
-    
-    def __init__(self, api_key: Optional[str] = None):
-        self.api_key = api_key or os.getenv("OPENAI_API_KEY")
-        self.client = OpenAI(api_key=self.api_key) if self.api_key else None
     
     @property
     def name(self) -> str:
-        return ToolName.IMPROVE_CONTENT_FROM_SLOP.value
+        return ToolName.ANALYZE_CONTENT_FOR_SLOP.value
     
     @property
     def description(self) -> str:
-        return "Use AI to rewrite text, removing slop and improving clarity while preserving meaning."
+        return "Analyze text for low-quality AI-generated content. Returns a score (0-10) where higher means more slop, plus specific issues and suggestions."
     
-    def execute(self, content: str, preserve_meaning: bool = True, target_tone: str = "professional", **kwargs) -> ToolResult:
-        if not self.client:
-            return ToolResult(
-                success=False,
-                data={},
-                error="OpenAI API key not configured. Set OPENAI_API_KEY environment variable."
-            )
-        
-        try:
-            completion = self.client.chat.completions.create(
-                model="gpt-4",
-                messages=[
-                    {
-                        "role": "system",
-                        "content": f"""You are a content improvement specialist. Rewrite the given text to remove "slop" while {'preserving the original meaning' if preserve_meaning else 'focusing on clarity'}. 
+    def _user_message(self, blocks: str, **kwargs) -> str:
+        return f"Analyze this content:\n\n{blocks}"
+    
+    def _to_data(self, item: Dict[str, Any], content: str, **kwargs) -> Dict[str, Any]:
+        return {
+            "score": item.get("score", 0),
+            "issues": item.get("issues", []),
+            "suggestions": item.get("suggestions", []),
+        }
+
+
+class ContentImprover(OpenAITool):
+    """Improve content by removing slop using AI."""
+    
+    MODEL = "gpt-4o-mini"
+    TEMPERATURE = 0.5
+    ERROR_MESSAGE = "Failed to improve content"
+    SYSTEM_PROMPT = """You are a content improvement specialist. Rewrite the given text to remove "slop", following the goal and tone given at the end of the user message.
+
+The text arrives as one or more numbered blocks, each starting with a line like ===1===. Rewrite every block independently.
 
 Remove:
 - Unnecessary qualifiers and hedging language
@@ -116,38 +247,32 @@ Remove:
 Make the content:
 - Concise and direct
 - Specific and concrete
-- {target_tone} in tone
+- In the requested tone
 - More impactful
 
-Return a JSON response with:
+Return a JSON response with a "results" array holding one object per block with:
+- index (the block number)
 - improved_content (the rewritten text)
 - changes_made (array describing what was improved)
 - original_word_count
 - new_word_count"""
-                    },
-                    {
-                        "role": "user",
-                        "content": f"Improve this content:\n\n{content}"
-                    }
-                ],
-                temperature=0.5,
-                response_format={"type": "json_object"}
-            )
-            
-            result = json.loads(completion.choices[0].message.content)
-            
-            return ToolResult(
-                success=True,
-                data={
-                    "improved_content": result.get("improved_content", content),
-                    "changes_made": result.get("changes_made", []),
-                    "original_word_count": result.get("original_word_count", len(content.split())),
-                    "new_word_count": result.get("new_word_count", len(result.get("improved_content", content).split())),
-                }
-            )
-        except Exception as e:
-            return ToolResult(
-                success=False,
-                data={},
-                error=f"Failed to improve content: {str(e)}"
-            )
+    
+    @property
+    def name(self) -> str:
+        return ToolName.IMPROVE_CONTENT_FROM_SLOP.value
+    
+    @property
+    def description(self) -> str:
+        return "Use AI to rewrite text, removing slop and improving clarity while preserving meaning."
+    
+    def _user_message(self, blocks: str, preserve_meaning: bool = True, target_tone: str = "professional", **kwargs) -> str:
+        goal = "Preserve the original meaning" if preserve_meaning else "Focus on clarity"
+        return f"Improve this content:\n\n{blocks}\n\n{goal}. Target tone: {target_tone}."
+    
+    def _to_data(self, item: Dict[str, Any], content: str, **kwargs) -> Dict[str, Any]:
+        return {
+            "improved_content": item.get("improved_content", content),
+            "changes_made": item.get("changes_made", []),
+            "original_word_count": item.get("original_word_count", len(content.split())),
+            "new_word_count": item.get("new_word_count", len(item.get("improved_content", content).split())),
+        }
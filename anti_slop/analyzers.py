@@ -1,8 +1,15 @@
 """Analysis tools for detecting slop patterns."""
+import heapq
 import re
-from typing import Dict, Any, List
+from bisect import bisect_right
+from collections import Counter
+from functools import lru_cache
+from operator import itemgetter
+from typing import Dict, Any, List, Sequence, Tuple
 from .base import BaseTool, ToolResult
 from .enums import ToolName
+from .patterns import PhraseScanner
+from .textdoc import MAX_CACHED_CHARS, TextDoc
 
 
 class AIPhrasesAnalyzer(BaseTool):
@@ -47,15 +54,12 @@ class AIPhrasesAnalyzer(BaseTool):
         return "Detect common AI-generated phrases like 'delve into', 'it's worth noting', 'in today's world', etc."
     
     def execute(self, content: str, **kwargs) -> ToolResult:
-        found = []
-        for phrase in self.PHRASES:
-            pattern = re.compile(r'\b' + re.escape(phrase) + r'\b', re.IGNORECASE)
-            matches = pattern.findall(content)
-            if matches:
-                found.append({
-                    "phrase": phrase,
-                    "count": len(matches),
-                })
+        counts = scan_phrases(content)[0]
+        found = [
+            {"phrase": phrase, "count": counts[phrase]}
+            for phrase in self.PHRASES
+            if phrase in counts
+        ]
         
         slop_score = min(10, len(found) * 2)
         
@@ -92,15 +96,12 @@ class ClicheAnalyzer(BaseTool):
         return "Detect business clichés and buzzwords like 'game changer', 'synergy', 'low-hanging fruit', etc."
     
     def execute(self, content: str, **kwargs) -> ToolResult:
-        found = []
-        for cliche in self.CLICHES:
-            pattern = re.compile(r'\b' + re.escape(cliche) + r'\b', re.IGNORECASE)
-            matches = pattern.findall(content)
-            if matches:
-                found.append({
-                    "cliche": cliche,
-                    "count": len(matches),
-                })
+        counts = scan_phrases(content)[1]
+        found = [
+            {"cliche": cliche, "count": counts[cliche]}
+            for cliche in self.CLICHES
+            if cliche in counts
+        ]
         
         return ToolResult(
             success=True,
@@ -112,13 +113,33 @@ class ClicheAnalyzer(BaseTool):
         )
 
 
+# AI phrases and clichés are found in one shared pass over the document
+PHRASE_SCAN = PhraseScanner(AIPhrasesAnalyzer.PHRASES, ClicheAnalyzer.CLICHES)
+
+
+def scan_phrases(content: str) -> Tuple[Counter, Counter]:
+    """Count (AI phrase, cliché) occurrences in content, keyed by phrase."""
+    if len(content) > MAX_CACHED_CHARS:
+        return _scan_phrases(content)
+    return _recent_scan(content)
+
+
+def _scan_phrases(content: str) -> Tuple[Counter, Counter]:
+    ai_phrases, cliches = PHRASE_SCAN.count(content, TextDoc.of(content).lower_content)
+    return ai_phrases, cliches
+
+
+_recent_scan = lru_cache(maxsize=32)(_scan_phrases)
+
+
 class PassiveVoiceAnalyzer(BaseTool):
     """Detect passive voice usage in text."""
     
-    PATTERNS = [
-        re.compile(r'\b(is|are|was|were|be|been|being)\s+\w+ed\b', re.IGNORECASE),
-        re.compile(r'\b(is|are|was|were|be|been|being)\s+\w+en\b', re.IGNORECASE)
-    ]
+    # The lookahead grabs the whole participle in one step and the lookbehind
+    # checks its ending, so long words are never backtracked through
+    PATTERN = re.compile(
+        r'\b(?:is|are|was|were|be|been|being)\s+(?=(\w+))\1(?<=\w(?:ed|en))', re.IGNORECASE
+    )
     
     @property
     def name(self) -> str:
@@ -129,23 +150,27 @@ class PassiveVoiceAnalyzer(BaseTool):
         return "Detect passive voice usage in text and calculate percentage of passive sentences."
     
     def execute(self, content: str, **kwargs) -> ToolResult:
-        matches = []
-        for pattern in self.PATTERNS:
-            found = pattern.findall(content)
-            matches.extend(found)
+        doc = TextDoc.of(content)
+        sentence_count = len(doc.sentences)
+        ends = doc.sentence_ends
         
-        sentences = [s.strip() for s in re.split(r'[.!?]+', content) if s.strip()]
-        passive_sentences = [s for s in sentences if any(p.search(s) for p in self.PATTERNS)]
+        matches = 0
+        passive_sentences = set()
+        for match in self.PATTERN.finditer(content):
+            matches += 1
+            passive_sentences.add(bisect_right(ends, match.start()))
         
-        percentage = round((len(passive_sentences) / len(sentences)) * 100) if sentences else 0
+        percentage = (
+            round((len(passive_sentences) / sentence_count) * 100) if sentence_count else 0
+        )
         
         return ToolResult(
             success=True,
             data={
-                "total_sentences": len(sentences),
+                "total_sentences": sentence_count,
                 "passive_sentences": len(passive_sentences),
                 "passive_percentage": percentage,
-                "passive_phrases_found": len(matches),
+                "passive_phrases_found": matches,
             }
         )
 
@@ -161,37 +186,60 @@ class ReadabilityAnalyzer(BaseTool):
     def description(self) -> str:
         return "Calculate Flesch reading ease score, grade level, and other readability metrics."
     
-    @staticmethod
-    def count_syllables(word: str) -> int:
-        word = re.sub(r'[^a-z]', '', word.lower())
+    VOWELS = frozenset('aeiouy')
+    NON_LETTERS = re.compile(r'[^a-z]+')
+    
+    @classmethod
+    def count_syllables(cls, word: str) -> int:
+        word = word.lower()
+        # Most words are plain letters already; the rest are stripped in one C-level pass
+        if not (word.isascii() and word.isalpha()):
+            word = cls.NON_LETTERS.sub('', word)
         if len(word) <= 3:
             return 1
-        word = re.sub(r'(?:[^laeiouy]es|ed|[^laeiouy]e)$', '', word)
-        word = re.sub(r'^y', '', word)
-        syllables = re.findall(r'[aeiouy]{1,2}', word)
-        return len(syllables) if syllables else 1
+        
+        # Silent endings: consonant + "es", "ed", or consonant + "e"
+        if word.endswith('es') and word[-3] not in 'laeiouy':
+            word = word[:-3]
+        elif word.endswith('ed'):
+            word = word[:-2]
+        elif word.endswith('e') and word[-2] not in 'laeiouy':
+            word = word[:-2]
+        if word.startswith('y'):
+            word = word[1:]
+        
+        # One syllable per started pair of vowels in each vowel run
+        syllables = 0
+        run = 0
+        for ch in word:
+            if ch in cls.VOWELS:
+                run += 1
+                if run % 2:
+                    syllables += 1
+            else:
+                run = 0
+        return syllables or 1
     
-    @staticmethod
-    def get_difficulty(flesch_score: float) -> str:
-        if flesch_score >= 90:
-            return 'Very Easy'
-        elif flesch_score >= 80:
-            return 'Easy'
-        elif flesch_score >= 70:
-            return 'Fairly Easy'
-        elif flesch_score >= 60:
-            return 'Standard'
-        elif flesch_score >= 50:
-            return 'Fairly Difficult'
-        elif flesch_score >= 30:
-            return 'Difficult'
-        return 'Very Difficult'
+    # Lower bound of each band after the first, and the label of every band
+    DIFFICULTY_THRESHOLDS = (30, 50, 60, 70, 80, 90)
+    DIFFICULTY_LABELS = (
+        'Very Difficult', 'Difficult', 'Fairly Difficult', 'Standard',
+        'Fairly Easy', 'Easy', 'Very Easy',
+    )
+    
+    @classmethod
+    def get_difficulty(cls, flesch_score: float) -> str:
+        return cls.DIFFICULTY_LABELS[bisect_right(cls.DIFFICULTY_THRESHOLDS, flesch_score)]
     
     def execute(self, content: str, **kwargs) -> ToolResult:
-        sentences = len([s for s in re.split(r'[.!?]+', content) if s.strip()])
-        words_list = [w for w in content.split() if w.strip()]
+        doc = TextDoc.of(content)
+        sentences = len(doc.sentences)
+        words_list = doc.words
         words = len(words_list)
-        syllables = sum(self.count_syllables(word) for word in words_list)
+        # Common words repeat a lot, so count each distinct word's syllables once
+        syllables = sum(
+            self.count_syllables(word) * count for word, count in Counter(words_list).items()
+        )
         
         avg_sentence_length = words / sentences if sentences > 0 else 0
         avg_syllables_per_word = syllables / words if words > 0 else 0
@@ -230,22 +278,39 @@ class RepetitionAnalyzer(BaseTool):
     def description(self) -> str:
         return "Find repeated phrases in text (helps identify redundant content)."
     
+    @staticmethod
+    def _ngrams(words: Sequence[str], length: int):
+        return zip(*(words[i:] for i in range(length)))
+    
     def execute(self, content: str, min_length: int = 3, **kwargs) -> ToolResult:
-        words = [w.lower() for w in content.split() if w.strip()]
-        phrases = {}
+        words = TextDoc.of(content).lower_words
+        found = []
+        prefixes = None
         
-        for length in range(min_length, 6):
-            for i in range(len(words) - length + 1):
-                phrase = ' '.join(words[i:i + length])
-                phrases[phrase] = phrases.get(phrase, 0) + 1
+        # Phrases have at least one word, however low min_length is set
+        for length in range(max(min_length, 1), 6):
+            grams = self._ngrams(words, length)
+            if prefixes is not None:
+                # A phrase can only repeat if its one-word-shorter prefix did
+                grams = (
+                    gram
+                    for prefix, gram in zip(self._ngrams(words, length - 1), grams)
+                    if prefix in prefixes
+                )
+            survivors = set()
+            for gram, count in Counter(grams).items():
+                if count > 1:
+                    survivors.add(gram)
+                    found.append((gram, count))
+            if not survivors:
+                break
+            prefixes = survivors
         
+        # Same order as a stable descending sort, without sorting every phrase
         repeated = [
-            {"phrase": phrase, "count": count}
-            for phrase, count in phrases.items()
-            if count > 1
+            {"phrase": ' '.join(gram), "count": count}
+            for gram, count in heapq.nlargest(20, found, key=itemgetter(1))
         ]
-        repeated.sort(key=lambda x: x["count"], reverse=True)
-        repeated = repeated[:20]
         
         repetition_score = min(10, len(repeated) // 2)
         
@@ -271,15 +336,16 @@ class RunOnSentenceAnalyzer(BaseTool):
         return "Detect overly long run-on sentences that should be split."
     
     def execute(self, content: str, max_words: int = 30, **kwargs) -> ToolResult:
-        sentences = [s.strip() for s in re.split(r'[.!?]+', content) if s.strip()]
+        doc = TextDoc.of(content)
+        sentences = doc.sentences
         
         run_on_sentences = [
             {
                 "sentence": sentence[:100] + "..." if len(sentence) > 100 else sentence,
-                "word_count": len(sentence.split())
+                "word_count": word_count
             }
-            for sentence in sentences
-            if len(sentence.split()) > max_words
+            for sentence, word_count in zip(sentences, doc.sentence_word_counts)
+            if word_count > max_words
         ]
         
         percentage = round((len(run_on_sentences) / len(sentences)) * 100) if sentences else 0
@@ -1,19 +1,32 @@
 """Base classes for anti-slop tools."""
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Dict, Any
-from pydantic import BaseModel
+from dataclasses import dataclass
+from typing import Dict, Any, Optional
 
 
-class ToolResult(BaseModel):
+@dataclass(slots=True)
+class ToolResult:
     """Standard result format for all tools."""
     success: bool
     data: Dict[str, Any]
     error: str | None = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert result to dictionary representation."""
+        return {
+            "success": self.success,
+            "data": self.data,
+            "error": self.error,
+        }
 
 
 class BaseTool(ABC):
     """Base class for all anti-slop tools."""
     
+    # Seconds a cached result stays valid in the registry (None = until evicted)
+    CACHE_TTL: Optional[float] = None
+    
     @property
     @abstractmethod
     def name(self) -> str:
@@ -31,6 +44,14 @@ class BaseTool(ABC):
         """Execute the tool with given arguments."""
         pass
     
+    async def aexecute(self, **kwargs) -> ToolResult:
+        """Execute the tool without blocking the event loop.
+
+        The default runs execute() in a worker thread; tools with native async
+        I/O override it.
+        """
+        return await asyncio.to_thread(self.execute, **kwargs)
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert tool to dictionary representation."""
         return {
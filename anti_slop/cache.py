@@ -0,0 +1,78 @@
+"""In-process cache for tool results."""
+import copy
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+
+class ResultCache:
+    """LRU cache of successful tool result data with optional per-entry expiry.
+
+    Besides the entry count, the cache is bounded by the total length of the
+    strings it holds (cleaner results keep both the original and the cleaned
+    text), and content longer than ``max_content_chars`` is never cached.
+    """
+    
+    def __init__(self, maxsize: int = 512, max_chars: int = 8_000_000, max_content_chars: int = 200_000):
+        self.maxsize = maxsize
+        self.max_chars = max_chars
+        self.max_content_chars = max_content_chars
+        self._entries: "OrderedDict[Hashable, Tuple[Optional[float], int, Dict[str, Any]]]" = OrderedDict()
+        self._chars = 0
+        self._lock = threading.Lock()
+    
+    def make_key(self, tool_name: str, kwargs: Dict[str, Any]) -> Optional[Hashable]:
+        """Build a cache key, or return None if the arguments can't be cached."""
+        content = kwargs.get("content")
+        if not isinstance(content, str) or len(content) > self.max_content_chars:
+            return None
+        
+        digest = hashlib.blake2b(content.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+        options = tuple(sorted((k, v) for k, v in kwargs.items() if k != "content"))
+        key = (tool_name, digest, options)
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+    
+    def get(self, key: Hashable) -> Optional[Dict[str, Any]]:
+        """Return a copy of the cached data for key, if present and not expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, size, data = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._entries[key]
+                self._chars -= size
+                return None
+            self._entries.move_to_end(key)
+        # Deep, so callers never share the nested lists and dicts of the entry
+        return copy.deepcopy(data)
+    
+    def set(self, key: Hashable, data: Dict[str, Any], ttl: Optional[float] = None):
+        """Store data under key, evicting least recently used entries while over budget."""
+        if self.maxsize <= 0:
+            return
+        size = sum(len(value) for value in data.values() if isinstance(value, str))
+        if size > self.max_chars:
+            return
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        data = copy.deepcopy(data)
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._chars -= old[1]
+            self._entries[key] = (expires_at, size, data)
+            self._chars += size
+            while len(self._entries) > self.maxsize or self._chars > self.max_chars:
+                self._chars -= self._entries.popitem(last=False)[1][1]
+    
+    def clear(self):
+        """Drop all cached results."""
+        with self._lock:
+            self._entries.clear()
+            self._chars = 0
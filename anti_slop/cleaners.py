@@ -1,17 +1,30 @@
 """Cleaning tools for removing slop patterns."""
 import re
-from typing import Dict, List
+from collections import Counter
+from typing import Dict, List, Optional, Sequence
 from .base import BaseTool, ToolResult
 from .enums import ToolName
+from .patterns import EXTRA_WHITESPACE, PhraseScanner, phrase_key, phrase_pattern, squash_whitespace
 
 
-class FillerWordsCleaner(BaseTool):
+class PatternCleaner(BaseTool):
+    """Cleaner that rewrites every match of a single PATTERN."""
+    
+    PATTERN: re.Pattern
+    
+    def replacement(self, match: re.Match) -> str:
+        """Text to substitute for one match of PATTERN."""
+        return ''
+
+
+class FillerWordsCleaner(PatternCleaner):
     """Remove filler words from text."""
     
     FILLER_WORDS = [
         'actually', 'basically', 'literally', 'just', 'very', 
         'really', 'quite', 'rather', 'somewhat', 'perhaps', 'maybe'
     ]
+    PATTERN = phrase_pattern(FILLER_WORDS)
     
     @property
     def name(self) -> str:
@@ -22,18 +35,16 @@ class FillerWordsCleaner(BaseTool):
         return "Remove filler words like 'actually', 'basically', 'literally', 'just', 'very', 'really', etc."
     
     def execute(self, content: str, **kwargs) -> ToolResult:
-        found = {}
-        cleaned = content
+        counts = Counter()
+        
+        def remove(match: re.Match) -> str:
+            counts[phrase_key(match.group(0), self.FILLER_WORDS)] += 1
+            return ''
         
-        for word in self.FILLER_WORDS:
-            pattern = re.compile(r'\b' + word + r'\b', re.IGNORECASE)
-            matches = pattern.findall(content)
-            if matches:
-                found[word] = len(matches)
-                cleaned = pattern.sub('', cleaned)
+        cleaned = self.PATTERN.sub(remove, content)
+        found = {word: counts[word] for word in self.FILLER_WORDS if word in counts}
         
-        cleaned = re.sub(r'\s+', ' ', cleaned)
-        cleaned = re.sub(r'\s+([.,!?;:])', r'\1', cleaned).strip()
+        cleaned = squash_whitespace(cleaned)
         
         return ToolResult(
             success=True,
@@ -46,7 +57,7 @@ class FillerWordsCleaner(BaseTool):
         )
 
 
-class HedgingCleaner(BaseTool):
+class HedgingCleaner(PatternCleaner):
     """Remove hedging language from text."""
     
     HEDGE_PHRASES = [
@@ -58,6 +69,10 @@ class HedgingCleaner(BaseTool):
         'somewhat', 'fairly', 'relatively',
         'could potentially', 'might possibly'
     ]
+    # Used by CleaningPipeline; execute() keeps the per-phrase semantics below
+    PATTERN = phrase_pattern(HEDGE_PHRASES)
+    SCANNER = PhraseScanner(HEDGE_PHRASES)
+    PHRASE_PATTERNS = {phrase: phrase_pattern([phrase]) for phrase in HEDGE_PHRASES}
     
     @property
     def name(self) -> str:
@@ -68,18 +83,18 @@ class HedgingCleaner(BaseTool):
         return "Remove hedging language like 'perhaps', 'maybe', 'might', 'it seems', etc. to make text more direct."
     
     def execute(self, content: str, **kwargs) -> ToolResult:
-        found = {}
-        cleaned = content
+        # Every phrase is counted in the original text, nested ones included
+        # ('might' inside 'it might be'), in a single scan
+        counts = self.SCANNER.count(content)[0]
+        found = {phrase: counts[phrase] for phrase in self.HEDGE_PHRASES if phrase in counts}
         
-        for phrase in self.HEDGE_PHRASES:
-            pattern = re.compile(r'\b' + re.escape(phrase) + r'\b', re.IGNORECASE)
-            matches = pattern.findall(content)
-            if matches:
-                found[phrase] = len(matches)
-                cleaned = pattern.sub('', cleaned)
+        # Found phrases are removed one at a time in list order, so where two
+        # overlap the earlier one wins ('could' leaves 'potentially' behind)
+        cleaned = content
+        for phrase in found:
+            cleaned = self.PHRASE_PATTERNS[phrase].sub('', cleaned)
         
-        cleaned = re.sub(r'\s+', ' ', cleaned)
-        cleaned = re.sub(r'\s+([.,!?;:])', r'\1', cleaned).strip()
+        cleaned = squash_whitespace(cleaned)
         
         return ToolResult(
             success=True,
@@ -92,7 +107,7 @@ class HedgingCleaner(BaseTool):
         )
 
 
-class RedundancyCleaner(BaseTool):
+class RedundancyCleaner(PatternCleaner):
     """Remove redundant phrases from text."""
     
     REDUNDANCIES = [
@@ -113,6 +128,8 @@ class RedundancyCleaner(BaseTool):
         {'phrase': 'true fact', 'replacement': 'fact'},
         {'phrase': 'unexpected surprise', 'replacement': 'surprise'}
     ]
+    REPLACEMENTS = {item['phrase']: item['replacement'] for item in REDUNDANCIES}
+    PATTERN = phrase_pattern(REPLACEMENTS)
     
     @property
     def name(self) -> str:
@@ -122,20 +139,22 @@ class RedundancyCleaner(BaseTool):
     def description(self) -> str:
         return "Remove redundant phrases like 'past history', 'future plans', 'absolutely essential', etc."
     
+    def replacement(self, match: re.Match) -> str:
+        return self.REPLACEMENTS[phrase_key(match.group(0), self.REPLACEMENTS)]
+    
     def execute(self, content: str, **kwargs) -> ToolResult:
-        cleaned = content
-        found = []
-        
-        for item in self.REDUNDANCIES:
-            pattern = re.compile(r'\b' + re.escape(item['phrase']) + r'\b', re.IGNORECASE)
-            matches = pattern.findall(content)
-            if matches:
-                found.append({
-                    "phrase": item['phrase'],
-                    "replacement": item['replacement'],
-                    "count": len(matches)
-                })
-                cleaned = pattern.sub(item['replacement'], cleaned)
+        counts = Counter()
+        
+        def replace(match: re.Match) -> str:
+            counts[phrase_key(match.group(0), self.REPLACEMENTS)] += 1
+            return self.replacement(match)
+        
+        cleaned = self.PATTERN.sub(replace, content)
+        found = [
+            {"phrase": phrase, "replacement": replacement, "count": counts[phrase]}
+            for phrase, replacement in self.REPLACEMENTS.items()
+            if phrase in counts
+        ]
         
         return ToolResult(
             success=True,
@@ -148,10 +167,10 @@ class RedundancyCleaner(BaseTool):
         )
 
 
-class EmojiCleaner(BaseTool):
+class EmojiCleaner(PatternCleaner):
     """Remove emojis from text."""
     
-    EMOJI_PATTERN = re.compile(
+    EMOJI_CLASS = (
         "["
         "\U0001F600-\U0001F64F"
         "\U0001F300-\U0001F5FF"
@@ -165,9 +184,10 @@ class EmojiCleaner(BaseTool):
         "\U00002600-\U000026FF"
         "\U00002700-\U000027BF"
         "\U0001F1E0-\U0001F1FF"
-        "]+",
-        flags=re.UNICODE
+        "]"
     )
+    EMOJI_PATTERN = re.compile(EMOJI_CLASS + "+", flags=re.UNICODE)
+    PATTERN = EMOJI_PATTERN
     
     @property
     def name(self) -> str:
@@ -178,9 +198,12 @@ class EmojiCleaner(BaseTool):
         return "Remove all emojis from text."
     
     def execute(self, content: str, **kwargs) -> ToolResult:
-        emojis = self.EMOJI_PATTERN.findall(content)
-        cleaned = self.EMOJI_PATTERN.sub('', content)
-        cleaned = re.sub(r'\s+', ' ', cleaned).strip()
+        # No emoji is ASCII, so only whitespace needs collapsing. Otherwise plain
+        # findall/sub passes stay in C, where a fused pass would need a Python
+        # callback for every whitespace run.
+        emojis = [] if content.isascii() else self.EMOJI_PATTERN.findall(content)
+        cleaned = self.EMOJI_PATTERN.sub('', content) if emojis else content
+        cleaned = EXTRA_WHITESPACE.sub(' ', cleaned).strip()
         
         return ToolResult(
             success=True,
@@ -196,6 +219,11 @@ class EmojiCleaner(BaseTool):
 class WhitespaceCleaner(BaseTool):
     """Normalize whitespace in text."""
     
+    TABS_TO_SPACES = str.maketrans('\t', ' ')
+    # Space runs, 3+ newlines, and the CR of each CRLF, all in one pass
+    PATTERN = re.compile(r' {2,}|\n{3,}|\r(?=\n)')
+    REPLACEMENTS = {' ': ' ', '\n': '\n\n', '\r': ''}
+    
     @property
     def name(self) -> str:
         return ToolName.NORMALIZE_WHITESPACE.value
@@ -205,12 +233,8 @@ class WhitespaceCleaner(BaseTool):
         return "Normalize whitespace, removing extra spaces, tabs, and blank lines."
     
     def execute(self, content: str, **kwargs) -> ToolResult:
-        normalized = content
-        normalized = normalized.replace('\t', ' ')
-        normalized = re.sub(r' +', ' ', normalized)
-        normalized = re.sub(r'\n\n+', '\n\n', normalized)
-        normalized = normalized.replace('\r\n', '\n')
-        normalized = normalized.strip()
+        normalized = content.translate(self.TABS_TO_SPACES)
+        normalized = self.PATTERN.sub(self._collapse, normalized).strip()
         
         chars_removed = len(content) - len(normalized)
         
@@ -222,3 +246,55 @@ class WhitespaceCleaner(BaseTool):
                 "characters_removed": chars_removed,
             }
         )
+    
+    def _collapse(self, match: re.Match) -> str:
+        return self.REPLACEMENTS[match.group(0)[0]]
+
+
+class CleaningPipeline:
+    """Apply several pattern cleaners to text in a single substitution pass.
+
+    Each cleaner's PATTERN becomes one named group of a combined regex, so the
+    document is rewritten once rather than once per cleaner, and whitespace
+    is normalized once at the end. Every cleaner sees the original text: a
+    phrase that would only form after an earlier removal is left alone. Where
+    two cleaners match at the same spot, the one listed first wins.
+    """
+    
+    def __init__(self, cleaners: Optional[Sequence[PatternCleaner]] = None):
+        if cleaners is None:
+            cleaners = [FillerWordsCleaner(), HedgingCleaner(), RedundancyCleaner(), EmojiCleaner()]
+        self.cleaners = list(cleaners)
+        self.pattern = re.compile('|'.join(
+            f'(?P<s{i}>{self._scoped(cleaner.PATTERN)})' for i, cleaner in enumerate(self.cleaners)
+        ))
+    
+    @staticmethod
+    def _scoped(pattern: re.Pattern) -> str:
+        # Keep case-insensitivity local to the stage that asked for it
+        if pattern.flags & re.IGNORECASE:
+            return f'(?i:{pattern.pattern})'
+        return pattern.pattern
+    
+    def execute(self, content: str) -> ToolResult:
+        counts = [Counter() for _ in self.cleaners]
+        
+        def dispatch(match: re.Match) -> str:
+            stage = int(match.lastgroup[1:])
+            counts[stage][match.group(0).lower()] += 1
+            return self.cleaners[stage].replacement(match)
+        
+        cleaned = self.pattern.sub(dispatch, content) if self.cleaners else content
+        cleaned = squash_whitespace(cleaned)
+        
+        return ToolResult(
+            success=True,
+            data={
+                "original_content": content,
+                "cleaned_content": cleaned,
+                "changes": {
+                    cleaner.name: dict(stage_counts)
+                    for cleaner, stage_counts in zip(self.cleaners, counts)
+                },
+            }
+        )
@@ -1,5 +1,6 @@
 """Formatters for converting tool results to different output formats."""
 from abc import ABC, abstractmethod
+from itertools import islice
 from typing import Any, Dict, List
 from anti_slop.base import ToolResult
 
@@ -22,29 +23,12 @@ class TextFormatter(BaseFormatter):
             return f"Error: {result.error}"
         
         data = result.data
-        response_parts = []
         
-        # Determine formatter method based on data structure
-        if "cleaned_content" in data:
-            response_parts = self._format_cleaned_content(data)
-        elif "normalized_content" in data:
-            response_parts = self._format_normalized_content(data)
-        elif "phrases_detected" in data:
-            response_parts = self._format_ai_phrases(data)
-        elif "cliches_detected" in data:
-            response_parts = self._format_cliches(data)
-        elif "passive_percentage" in data:
-            response_parts = self._format_passive_voice(data)
-        elif "readability" in data:
-            response_parts = self._format_readability(data)
-        elif "repeated_phrases" in data:
-            response_parts = self._format_repetition(data)
-        elif "run_on_sentences" in data:
-            response_parts = self._format_run_on_sentences(data)
-        elif "score" in data:
-            response_parts = self._format_analysis(data)
-        elif "improved_content" in data:
-            response_parts = self._format_improved_content(data)
+        # Pick the formatter method from the first known key in the data
+        for key, format_data in self.DISPATCH:
+            if key in data:
+                response_parts = format_data(self, data)
+                break
         else:
             response_parts = [str(data)]
         
@@ -52,27 +36,27 @@ class TextFormatter(BaseFormatter):
     
     def _format_cleaned_content(self, data: Dict[str, Any]) -> List[str]:
         """Format cleaned content results."""
-        parts = [f"Cleaned Content:\n{data['cleaned_content']}\n"]
+        # The document goes in as its own part so the final join copies it only once
+        parts = ["Cleaned Content:", data['cleaned_content'], ""]
         
         if "filler_words_removed" in data:
             parts.append(f"Removed {data['filler_words_removed']} filler words")
             if data.get("breakdown"):
-                parts.append(":\n" + "\n".join(
-                    f"- {word}: {count}" for word, count in data["breakdown"].items()
-                ))
+                parts.append(":")
+                parts.extend(f"- {word}: {count}" for word, count in data["breakdown"].items())
         elif "hedging_removed" in data:
             parts.append(f"Removed {data['hedging_removed']} hedging phrases")
             if data.get("breakdown"):
-                parts.append(":\n" + "\n".join(
-                    f"- '{phrase}': {count}" for phrase, count in data["breakdown"].items()
-                ))
+                parts.append(":")
+                parts.extend(f"- '{phrase}': {count}" for phrase, count in data["breakdown"].items())
         elif "redundancies_removed" in data:
             parts.append(f"Removed {data['redundancies_removed']} redundancies")
             if data.get("changes"):
-                parts.append(":\n" + "\n".join(
+                parts.append(":")
+                parts.extend(
                     f"- '{c['phrase']}' → '{c['replacement']}' ({c['count']} times)" 
                     for c in data["changes"]
-                ))
+                )
         elif "emojis_removed" in data:
             parts.append(f"Removed {data['emojis_removed']} emoji(s)")
         
@@ -81,38 +65,39 @@ class TextFormatter(BaseFormatter):
     def _format_normalized_content(self, data: Dict[str, Any]) -> List[str]:
         """Format normalized content results."""
         return [
-            f"Normalized Content:\n{data['normalized_content']}\n",
+            "Normalized Content:",
+            data['normalized_content'],
+            "",
             f"Removed {data['characters_removed']} extra whitespace character(s)"
         ]
     
     def _format_ai_phrases(self, data: Dict[str, Any]) -> List[str]:
         """Format AI phrases detection results."""
-        parts = [
-            f"AI Phrases Detected: {data['phrases_detected']}",
-            f"Slop Score: {data['slop_score']}/10\n"
-        ]
-        
-        if data['phrases']:
-            parts.append("\n".join(
-                f"'{p['phrase']}' - found {p['count']} time(s)" 
-                for p in data['phrases']
-            ))
-        else:
-            parts.append("No AI phrases detected. Content looks clean!")
-        
-        return parts
+        return self._format_items(
+            f"AI Phrases Detected: {data['phrases_detected']}\n"
+            f"Slop Score: {data['slop_score']}/10\n",
+            data['phrases'], 'phrase', "'{}' - found {} time(s)",
+            "No AI phrases detected. Content looks clean!"
+        )
     
     def _format_cliches(self, data: Dict[str, Any]) -> List[str]:
         """Format cliché detection results."""
-        parts = [f"Clichés Detected: {data['cliches_detected']}\n"]
-        
-        if data['cliches']:
-            parts.append("\n".join(
-                f"'{c['cliche']}' - {c['count']} time(s)" 
-                for c in data['cliches']
-            ))
+        return self._format_items(
+            f"Clichés Detected: {data['cliches_detected']}\n",
+            data['cliches'], 'cliche', "'{}' - {} time(s)",
+            "No clichés detected!"
+        )
+    
+    def _format_items(
+        self, header: str, items: List[Dict[str, Any]], key: str, line: str, empty: str
+    ) -> List[str]:
+        """Format a header plus one line per counted item, or a fallback message."""
+        parts = [header]
+        
+        if items:
+            parts.extend(line.format(item[key], item['count']) for item in items)
         else:
-            parts.append("No clichés detected!")
+            parts.append(empty)
         
         return parts
     
@@ -125,10 +110,10 @@ class TextFormatter(BaseFormatter):
         )
         
         return [
-            "Passive Voice Analysis:",
-            f"Total Sentences: {data['total_sentences']}",
-            f"Passive Sentences: {data['passive_sentences']} ({data['passive_percentage']}%)",
-            f"Passive Phrases Found: {data['passive_phrases_found']}\n",
+            "Passive Voice Analysis:\n"
+            f"Total Sentences: {data['total_sentences']}\n"
+            f"Passive Sentences: {data['passive_sentences']} ({data['passive_percentage']}%)\n"
+            f"Passive Phrases Found: {data['passive_phrases_found']}\n\n"
             f"Recommendation: {recommendation}"
         ]
     
@@ -138,46 +123,40 @@ class TextFormatter(BaseFormatter):
         read = data['readability']
         
         return [
-            "Readability Analysis:",
-            f"Flesch Reading Ease: {read['flesch_reading_ease']}/100",
-            f"Difficulty: {read['difficulty']}",
-            f"Grade Level: {read['grade_level']}\n",
-            "Statistics:",
-            f"- Sentences: {stats['sentences']}",
-            f"- Words: {stats['words']}",
-            f"- Syllables: {stats['syllables']}",
-            f"- Avg Sentence Length: {stats['avg_sentence_length']} words",
+            "Readability Analysis:\n"
+            f"Flesch Reading Ease: {read['flesch_reading_ease']}/100\n"
+            f"Difficulty: {read['difficulty']}\n"
+            f"Grade Level: {read['grade_level']}\n\n"
+            "Statistics:\n"
+            f"- Sentences: {stats['sentences']}\n"
+            f"- Words: {stats['words']}\n"
+            f"- Syllables: {stats['syllables']}\n"
+            f"- Avg Sentence Length: {stats['avg_sentence_length']} words\n"
             f"- Avg Syllables per Word: {stats['avg_syllables_per_word']}"
         ]
     
     def _format_repetition(self, data: Dict[str, Any]) -> List[str]:
         """Format repetition detection results."""
-        parts = [f"Repeated Phrases Found: {data['repeated_phrases']}\n"]
-        
-        if data['phrases']:
-            parts.append("\n".join(
-                f"'{p['phrase']}' - {p['count']} times" 
-                for p in data['phrases']
-            ))
-        else:
-            parts.append("No significant repetition detected.")
-        
-        return parts
+        return self._format_items(
+            f"Repeated Phrases Found: {data['repeated_phrases']}\n",
+            data['phrases'], 'phrase', "'{}' - {} times",
+            "No significant repetition detected."
+        )
     
     def _format_run_on_sentences(self, data: Dict[str, Any]) -> List[str]:
         """Format run-on sentence detection results."""
         parts = [
-            "Run-on Sentence Analysis:",
-            f"Total Sentences: {data['total_sentences']}",
+            "Run-on Sentence Analysis:\n"
+            f"Total Sentences: {data['total_sentences']}\n"
             f"Run-on Sentences: {data['run_on_sentences']} ({data['percentage']}%)\n"
         ]
         
         if data['sentences']:
             parts.append("Run-on sentences found:")
-            parts.append("\n".join(
+            parts.extend(
                 f"- {s['word_count']} words: {s['sentence']}" 
-                for s in data['sentences'][:5]
-            ))
+                for s in islice(data['sentences'], 5)
+            )
         else:
             parts.append("No run-on sentences detected!")
         
@@ -189,21 +168,46 @@ class TextFormatter(BaseFormatter):
             "Analysis Results:",
             f"Score: {data['score']}/10\n",
             "Issues Found:",
-            "\n".join(f"- {issue}" for issue in data.get('issues', [])),
-            "\nSuggestions:",
-            "\n".join(f"- {suggestion}" for suggestion in data.get('suggestions', []))
         ]
+        parts.extend(self._bullets(data.get('issues', [])))
+        parts.append("\nSuggestions:")
+        parts.extend(self._bullets(data.get('suggestions', [])))
         
         return parts
     
     def _format_improved_content(self, data: Dict[str, Any]) -> List[str]:
         """Format improved content results."""
-        return [
-            f"Improved Content:\n{data['improved_content']}\n",
+        parts = [
+            "Improved Content:",
+            str(data['improved_content']),
+            "",
             "Changes Made:",
-            "\n".join(f"- {change}" for change in data.get('changes_made', [])),
-            f"\nWord Count: {data['original_word_count']} → {data['new_word_count']}"
         ]
+        parts.extend(self._bullets(data.get('changes_made', [])))
+        parts.append(f"\nWord Count: {data['original_word_count']} → {data['new_word_count']}")
+        
+        return parts
+    
+    @staticmethod
+    def _bullets(items: List[Any]) -> List[str]:
+        """One "- item" line per item; an empty list still leaves a blank line."""
+        return [f"- {item}" for item in items] or [""]
+    
+    # Checked in order; the first key present in the result data wins. Each
+    # tool's data has exactly one of these keys, so the order only affects
+    # speed: the detectors, called far more often than the cleaners, go first.
+    DISPATCH = (
+        ("phrases_detected", _format_ai_phrases),
+        ("cliches_detected", _format_cliches),
+        ("readability", _format_readability),
+        ("passive_percentage", _format_passive_voice),
+        ("repeated_phrases", _format_repetition),
+        ("run_on_sentences", _format_run_on_sentences),
+        ("score", _format_analysis),
+        ("cleaned_content", _format_cleaned_content),
+        ("normalized_content", _format_normalized_content),
+        ("improved_content", _format_improved_content),
+    )
 
 
 class JSONFormatter(BaseFormatter):
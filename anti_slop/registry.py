@@ -1,6 +1,9 @@
 """Tool registry for managing all anti-slop tools."""
-from typing import Dict, List, Optional
+import asyncio
+import os
+from typing import Dict, Iterable, List, Optional, Tuple
 from .base import BaseTool, ToolResult
+from .cache import ResultCache
 from .enums import ToolName
 from .analyzers import (
     AIPhrasesAnalyzer,
@@ -17,14 +20,22 @@ from .cleaners import (
     EmojiCleaner,
     WhitespaceCleaner,
 )
-from .ai_tools import ContentAnalyzer, ContentImprover
+from .textdoc import TextDoc
 
 
 class ToolRegistry:
     """Registry for all anti-slop tools."""
     
-    def __init__(self, openai_api_key: Optional[str] = None):
+    # Only registered when an OpenAI key is available
+    AI_TOOL_NAMES = frozenset({
+        ToolName.ANALYZE_CONTENT_FOR_SLOP.value,
+        ToolName.IMPROVE_CONTENT_FROM_SLOP.value,
+    })
+    UNKNOWN_TOOL_ERROR = "Unknown tool: {name}. Valid tools: " + ", ".join(ToolName.list_all())
+    
+    def __init__(self, openai_api_key: Optional[str] = None, cache_size: int = 512):
         self._tools: Dict[str, BaseTool] = {}
+        self._cache = ResultCache(maxsize=cache_size)
         self._register_tools(openai_api_key)
     
     def _register_tools(self, openai_api_key: Optional[str]):
@@ -44,9 +55,12 @@ class ToolRegistry:
         self.register(EmojiCleaner())
         self.register(WhitespaceCleaner())
         
-        # AI-powered tools
-        self.register(ContentAnalyzer(openai_api_key))
-        self.register(ContentImprover(openai_api_key))
+        # AI-powered tools, imported here since the openai client is slow to import
+        api_key = openai_api_key or os.getenv("OPENAI_API_KEY")
+        if api_key:
+            from .ai_tools import ContentAnalyzer, ContentImprover
+            self.register(ContentAnalyzer(api_key))
+            self.register(ContentImprover(api_key))
     
     def register(self, tool: BaseTool):
         """Register a tool."""
@@ -60,23 +74,106 @@ class ToolRegistry:
         """List all registered tools."""
         return list(self._tools.values())
     
-    def execute_tool(self, name: str | ToolName, **kwargs) -> ToolResult:
-        """Execute a tool by name."""
-        tool_name = name.value if isinstance(name, ToolName) else name
+    def _resolve(self, tool_name: str) -> Tuple[Optional[BaseTool], Optional[ToolResult]]:
+        """Look up a tool, returning an error result instead if it can't be used."""
+        tool = self._tools.get(tool_name)
+        if tool is not None:
+            return tool, None
         
-        if not ToolName.is_valid(tool_name):
-            return ToolResult(
+        if tool_name in self.AI_TOOL_NAMES:
+            return None, ToolResult(
                 success=False,
                 data={},
-                error=f"Unknown tool: {tool_name}. Valid tools: {', '.join(ToolName.list_all())}"
+                error="OpenAI API key not configured. Set OPENAI_API_KEY environment variable."
             )
         
-        tool = self.get_tool(tool_name)
-        if not tool:
-            return ToolResult(
+        if not ToolName.is_valid(tool_name):
+            return None, ToolResult(
                 success=False,
                 data={},
-                error=f"Tool '{tool_name}' not found in registry"
+                error=self.UNKNOWN_TOOL_ERROR.format(name=tool_name)
             )
         
-        return tool.execute(**kwargs)
+        return None, ToolResult(
+            success=False,
+            data={},
+            error=f"Tool '{tool_name}' not found in registry"
+        )
+    
+    def execute_tool(self, name: str | ToolName, **kwargs) -> ToolResult:
+        """Execute a tool by name."""
+        return self.execute_tool_str(name.value if isinstance(name, ToolName) else name, **kwargs)
+    
+    def execute_tool_enum(self, name: ToolName, **kwargs) -> ToolResult:
+        """Execute a tool by ToolName, skipping the type check in execute_tool()."""
+        return self.execute_tool_str(name.value, **kwargs)
+    
+    def execute_tool_str(self, tool_name: str, **kwargs) -> ToolResult:
+        """Execute a tool by its plain string name."""
+        tool, error = self._resolve(tool_name)
+        if error:
+            return error
+        
+        key = self._cache.make_key(tool_name, kwargs) if self._cache.maxsize > 0 else None
+        if key is not None:
+            cached = self._cache.get(key)
+            if cached is not None:
+                return ToolResult(success=True, data=cached)
+        
+        result = tool.execute(**kwargs)
+        if result.success and key is not None:
+            self._cache.set(key, result.data, ttl=tool.CACHE_TTL)
+        return result
+    
+    async def aexecute_tool(self, name: str | ToolName, **kwargs) -> ToolResult:
+        """Execute a tool by name without blocking the event loop.
+
+        Delegates to the tool's aexecute(): OpenAI-backed tools use the async
+        client, the regex-based tools run in a worker thread.
+        """
+        return await self.aexecute_tool_str(name.value if isinstance(name, ToolName) else name, **kwargs)
+    
+    async def aexecute_tool_enum(self, name: ToolName, **kwargs) -> ToolResult:
+        """Async variant of execute_tool_enum()."""
+        return await self.aexecute_tool_str(name.value, **kwargs)
+    
+    async def aexecute_tool_str(self, tool_name: str, **kwargs) -> ToolResult:
+        """Async variant of execute_tool_str()."""
+        tool, error = self._resolve(tool_name)
+        if error:
+            return error
+        
+        key = self._cache.make_key(tool_name, kwargs) if self._cache.maxsize > 0 else None
+        if key is not None:
+            cached = self._cache.get(key)
+            if cached is not None:
+                return ToolResult(success=True, data=cached)
+        
+        result = await tool.aexecute(**kwargs)
+        if result.success and key is not None:
+            self._cache.set(key, result.data, ttl=tool.CACHE_TTL)
+        return result
+    
+    async def run_many_async(
+        self,
+        content: str,
+        tool_names: Optional[Iterable[str | ToolName]] = None,
+        max_concurrency: int = 10,
+        **kwargs,
+    ) -> Dict[str, ToolResult]:
+        """Run several tools (all by default) over the same content concurrently."""
+        names = [
+            name.value if isinstance(name, ToolName) else name
+            for name in (tool_names if tool_names is not None else self._tools)
+        ]
+        # Wrap once so every analyzer reads the same lazily cached splits
+        content = TextDoc.of(content)
+        
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def run(name: str) -> ToolResult:
+            async with semaphore:
+                return await self.aexecute_tool_str(name, content=content, **kwargs)
+        
+        results = await asyncio.gather(*(run(name) for name in names))
+        return dict(zip(names, results))
@@ -0,0 +1,84 @@
+"""Document text with lazily computed, cached tokenizations."""
+from functools import cached_property, lru_cache
+from typing import Tuple
+from .patterns import SENTENCE_END
+
+# Longer documents are never held by module-level caches, which bounds their
+# memory by size as well as by entry count
+MAX_CACHED_CHARS = 200_000
+
+
+class TextDoc(str):
+    """A document whose sentence and word splits are computed once, on first use.
+
+    TextDoc is a str, so it can be passed anywhere content is expected. The
+    registry wraps content once before running several tools over it, and
+    each analyzer reads the cached splits instead of re-tokenizing.
+    """
+    
+    @classmethod
+    def of(cls, content: str) -> "TextDoc":
+        """Return content as a TextDoc, reusing a recent one for the same text.
+
+        Only content up to MAX_CACHED_CHARS long is remembered.
+        """
+        if isinstance(content, TextDoc):
+            return content
+        if len(content) > MAX_CACHED_CHARS:
+            return cls(content)
+        return _recent_doc(content)
+    
+    @cached_property
+    def _sentence_split(self) -> Tuple[Tuple[str, ...], Tuple[int, ...]]:
+        sentences = []
+        ends = []
+        start = 0
+        for match in SENTENCE_END.finditer(self):
+            sentence = self[start:match.start()].strip()
+            if sentence:
+                sentences.append(sentence)
+            ends.append(match.start())
+            start = match.end()
+        sentence = self[start:].strip()
+        if sentence:
+            sentences.append(sentence)
+        return tuple(sentences), tuple(ends)
+    
+    @property
+    def sentences(self) -> Tuple[str, ...]:
+        """Non-empty, stripped sentences split on runs of '.', '!' and '?'."""
+        return self._sentence_split[0]
+    
+    @property
+    def sentence_ends(self) -> Tuple[int, ...]:
+        """Start offset of every terminal punctuation run, in order.
+
+        A position ``p`` outside punctuation lies in raw segment
+        ``bisect_right(sentence_ends, p)``.
+        """
+        return self._sentence_split[1]
+    
+    @cached_property
+    def sentence_word_counts(self) -> Tuple[int, ...]:
+        """Number of whitespace-separated words in each of ``sentences``."""
+        return tuple(len(sentence.split()) for sentence in self.sentences)
+    
+    @cached_property
+    def words(self) -> Tuple[str, ...]:
+        """Whitespace-separated words."""
+        return tuple(self.split())
+    
+    @cached_property
+    def lower_content(self) -> str:
+        """The whole text lowercased, for case-sensitive matching of lowercase patterns."""
+        return self.lower()
+    
+    @cached_property
+    def lower_words(self) -> Tuple[str, ...]:
+        """Whitespace-separated words, lowercased."""
+        return tuple(self.lower_content.split())
+
+
+@lru_cache(maxsize=32)
+def _recent_doc(content: str) -> TextDoc:
+    return TextDoc(content)
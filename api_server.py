@@ -1,20 +1,46 @@
 #!/usr/bin/env python3
 """FastAPI server for anti-slop tools."""
 import os
-from fastapi import FastAPI, HTTPException
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel, Field
+from fastapi import Depends, FastAPI, HTTPException, Request
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, Field, ValidationError
 from typing import Optional
 from anti_slop import ToolRegistry, ToolName
 
 app = FastAPI(
     title="Anti-Slop API",
     description="API for detecting and cleaning low-quality AI-generated content",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
 )
 
 registry = ToolRegistry(openai_api_key=os.getenv("OPENAI_API_KEY"))
 
+# Default for the ?echo= query parameter; set to restore original_content in every response
+ECHO_ORIGINAL_CONTENT = os.getenv("ECHO_ORIGINAL_CONTENT", "").lower() in ("1", "true", "yes")
+
+# Longest content, in characters, a request may carry; longer content gets a 413
+MAX_CONTENT_LEN = int(os.getenv("MAX_CONTENT_LEN", "5000000"))
+
+# The registry doesn't change after startup, so the tool listings are built once
+_TOOLS_PAYLOAD = {
+    "tools": [
+        {
+            "name": tool.name,
+            "description": tool.description,
+            "enum_value": tool.name
+        }
+        for tool in registry.list_tools()
+    ],
+    "tool_names": ToolName.list_all()
+}
+_ROOT_PAYLOAD = {
+    "name": "Anti-Slop API",
+    "version": "1.0.0",
+    "tools": [tool.name for tool in registry.list_tools()]
+}
+
 
 class ToolRequest(BaseModel):
     """Generic request for tool execution."""
@@ -25,14 +51,35 @@ class ToolRequest(BaseModel):
     target_tone: Optional[str] = Field("professional", description="Target tone for content improvement")
 
 
+async def parse_tool_request(http_request: Request) -> ToolRequest:
+    """Validate the raw body bytes in one pydantic-core call instead of json.loads + validate."""
+    try:
+        request = ToolRequest.model_validate_json(await http_request.body())
+    except ValidationError as e:
+        # Match FastAPI's own body errors, whose locations start with "body"
+        raise RequestValidationError(
+            [{**error, "loc": ("body", *error["loc"])} for error in e.errors(include_url=False)]
+        )
+    if len(request.content) > MAX_CONTENT_LEN:
+        raise HTTPException(
+            status_code=413, detail=f"content is longer than {MAX_CONTENT_LEN} characters"
+        )
+    return request
+
+
+# The body is parsed by a dependency, so document it for OpenAPI explicitly
+TOOL_REQUEST_BODY = {
+    "requestBody": {
+        "content": {"application/json": {"schema": ToolRequest.model_json_schema()}},
+        "required": True,
+    }
+}
+
+
 @app.get("/")
 async def root():
     """Root endpoint."""
-    return {
-        "name": "Anti-Slop API",
-        "version": "1.0.0",
-        "tools": [tool.name for tool in registry.list_tools()]
-    }
+    return _ROOT_PAYLOAD
 
 
 @app.get("/health")
@@ -44,116 +91,69 @@ async def health():
 @app.get("/tools")
 async def list_tools():
     """List all available tools."""
-    return {
-        "tools": [
-            {
-                "name": tool.name,
-                "description": tool.description,
-                "enum_value": tool.name
-            }
-            for tool in registry.list_tools()
-        ],
-        "tool_names": ToolName.list_all()
-    }
+    return _TOOLS_PAYLOAD
 
 
-@app.post("/execute/{tool_name}")
-async def execute_tool(tool_name: ToolName, request: ToolRequest):
-    """Execute a specific tool."""
-    result = registry.execute_tool(
-        tool_name,
-        content=request.content,
-        min_length=request.min_length,
-        max_words=request.max_words,
-        preserve_meaning=request.preserve_meaning,
-        target_tone=request.target_tone,
-    )
+# Request fields each tool actually uses, besides content
+TOOL_KWARGS: dict[ToolName, tuple[str, ...]] = {
+    ToolName.DETECT_REPETITION: ("min_length",),
+    ToolName.DETECT_RUN_ON_SENTENCES: ("max_words",),
+    ToolName.IMPROVE_CONTENT_FROM_SLOP: ("preserve_meaning", "target_tone"),
+}
+
+
+async def _execute(tool_name: ToolName, request: ToolRequest, echo: bool) -> ORJSONResponse:
+    kwargs = {key: getattr(request, key) for key in TOOL_KWARGS.get(tool_name, ())}
+    result = await registry.aexecute_tool_enum(tool_name, content=request.content, **kwargs)
     
     if not result.success:
         raise HTTPException(status_code=400, detail=result.error)
     
-    return JSONResponse(content=result.data)
-
-
-# Convenience endpoints for each tool
-@app.post(f"/{ToolName.DETECT_AI_PHRASES.value}")
-async def detect_ai_phrases(request: ToolRequest):
-    """Detect AI-generated phrases."""
-    return await execute_tool(ToolName.DETECT_AI_PHRASES, request)
-
-
-@app.post(f"/{ToolName.REMOVE_FILLER_WORDS.value}")
-async def remove_filler_words(request: ToolRequest):
-    """Remove filler words."""
-    return await execute_tool(ToolName.REMOVE_FILLER_WORDS, request)
-
-
-@app.post(f"/{ToolName.DETECT_CLICHES.value}")
-async def detect_cliches(request: ToolRequest):
-    """Detect clichés."""
-    return await execute_tool(ToolName.DETECT_CLICHES, request)
-
-
-@app.post(f"/{ToolName.REMOVE_HEDGING.value}")
-async def remove_hedging(request: ToolRequest):
-    """Remove hedging language."""
-    return await execute_tool(ToolName.REMOVE_HEDGING, request)
-
-
-@app.post(f"/{ToolName.DETECT_PASSIVE_VOICE.value}")
-async def detect_passive_voice(request: ToolRequest):
-    """Detect passive voice."""
-    return await execute_tool(ToolName.DETECT_PASSIVE_VOICE, request)
-
-
-@app.post(f"/{ToolName.CALCULATE_READABILITY.value}")
-async def calculate_readability(request: ToolRequest):
-    """Calculate readability metrics."""
-    return await execute_tool(ToolName.CALCULATE_READABILITY, request)
-
-
-@app.post(f"/{ToolName.DETECT_REPETITION.value}")
-async def detect_repetition(request: ToolRequest):
-    """Detect repeated phrases."""
-    return await execute_tool(ToolName.DETECT_REPETITION, request)
-
-
-@app.post(f"/{ToolName.DETECT_RUN_ON_SENTENCES.value}")
-async def detect_run_on_sentences(request: ToolRequest):
-    """Detect run-on sentences."""
-    return await execute_tool(ToolName.DETECT_RUN_ON_SENTENCES, request)
-
-
-@app.post(f"/{ToolName.REMOVE_REDUNDANCIES.value}")
-async def remove_redundancies(request: ToolRequest):
-    """Remove redundant phrases."""
-    return await execute_tool(ToolName.REMOVE_REDUNDANCIES, request)
+    data = result.data
+    if not echo and "original_content" in data:
+        # The client already has the text it sent; don't serialize it back
+        # (copied, since result data may be shared through the registry cache)
+        data = {key: value for key, value in data.items() if key != "original_content"}
+    
+    # Returning the response directly skips FastAPI's jsonable_encoder pass
+    return ORJSONResponse(content=data)
 
 
-@app.post(f"/{ToolName.REMOVE_EMOJIS.value}")
-async def remove_emojis(request: ToolRequest):
-    """Remove emojis."""
-    return await execute_tool(ToolName.REMOVE_EMOJIS, request)
+@app.post("/execute/{tool_name}", openapi_extra=TOOL_REQUEST_BODY)
+async def execute_tool(
+    tool_name: ToolName, request: ToolRequest = Depends(parse_tool_request), echo: bool = ECHO_ORIGINAL_CONTENT
+):
+    """Execute a specific tool."""
+    return await _execute(tool_name, request, echo)
 
 
-@app.post(f"/{ToolName.NORMALIZE_WHITESPACE.value}")
-async def normalize_whitespace(request: ToolRequest):
-    """Normalize whitespace."""
-    return await execute_tool(ToolName.NORMALIZE_WHITESPACE, request)
+def _make_endpoint(tool_name: ToolName):
+    """Build a convenience endpoint with its tool name bound in."""
+    async def endpoint(request: ToolRequest = Depends(parse_tool_request), echo: bool = ECHO_ORIGINAL_CONTENT):
+        return await _execute(tool_name, request, echo)
+    
+    endpoint.__name__ = tool_name.value
+    tool = registry.get_tool(tool_name.value)
+    endpoint.__doc__ = tool.description if tool else None
+    return endpoint
 
 
-@app.post(f"/{ToolName.ANALYZE_CONTENT_FOR_SLOP.value}")
-async def analyze_content_for_slop(request: ToolRequest):
-    """Analyze content for slop using AI."""
-    return await execute_tool(ToolName.ANALYZE_CONTENT_FOR_SLOP, request)
+# Convenience endpoints for each tool
+for _tool_name in ToolName:
+    app.post(f"/{_tool_name.value}", openapi_extra=TOOL_REQUEST_BODY)(_make_endpoint(_tool_name))
 
 
-@app.post(f"/{ToolName.IMPROVE_CONTENT_FROM_SLOP.value}")
-async def improve_content_from_slop(request: ToolRequest):
-    """Improve content using AI."""
-    return await execute_tool(ToolName.IMPROVE_CONTENT_FROM_SLOP, request)
+def main():
+    """Run the API server."""
+    import uvicorn
+    # Tool calls are CPU-bound and independent, so default to one worker process per core
+    uvicorn.run(
+        "api_server:app",
+        host="0.0.0.0",
+        port=int(os.getenv("PORT", "3000")),
+        workers=int(os.getenv("WORKERS", os.cpu_count() or 1)),
+    )
 
 
 if __name__ == "__main__":
-    import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=int(os.getenv("PORT", "3000")))
+    main()
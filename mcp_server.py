@@ -17,24 +17,26 @@ server = Server("anti-slop-mcp")
 registry = ToolRegistry(openai_api_key=os.getenv("OPENAI_API_KEY"))
 formatter = TextFormatter()
 
+# Every tool takes the same input, so they all share one schema object
+_INPUT_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "content": {"type": "string", "description": "The text to process"}
+    },
+    "required": ["content"]
+}
+
+# The registry doesn't change after startup, so the tool listing is built once
+_MCP_TOOLS = [
+    types.Tool(name=tool.name, description=tool.description, inputSchema=_INPUT_SCHEMA)
+    for tool in registry.list_tools()
+]
+
 
 @server.list_tools()
 async def handle_list_tools() -> list[types.Tool]:
     """List all available tools."""
-    tools = []
-    for tool in registry.list_tools():
-        tools.append(types.Tool(
-            name=tool.name,
-            description=tool.description,
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "content": {"type": "string", "description": "The text to process"}
-                },
-                "required": ["content"]
-            }
-        ))
-    return tools
+    return _MCP_TOOLS
 
 
 @server.call_tool()
@@ -48,7 +50,7 @@ async def handle_call_tool(
             text="Error: Missing arguments"
         )]
     
-    result = registry.execute_tool(name, **arguments)
+    result = await registry.aexecute_tool_str(name, **arguments)
     formatted_text = formatter.format(result)
     
     return [types.TextContent(
@@ -75,4 +77,10 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    try:
+        # Faster event loop where available (not on Windows)
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
@@ -1,30 +1,187 @@
 import asyncio
+import heapq
+import json
 import re
 import os
 import logging
+from collections import Counter
+from functools import cached_property, lru_cache
+from operator import itemgetter
 from typing import Optional
 from mcp.server.models import InitializationOptions
 import mcp.types as types
 from mcp.server import NotificationOptions, Server
 import mcp.server.stdio
-from openai import OpenAI
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("anti-slop-mcp")
 
 api_key = os.getenv("OPENAI_API_KEY")
-client = OpenAI(api_key=api_key) if api_key else None
+_client = None
+
+def get_client():
+    """The OpenAI client, built on first use so only the AI tools pay for importing openai."""
+    global _client
+    if _client is None and api_key:
+        from openai import OpenAI
+        _client = OpenAI(api_key=api_key)
+    return _client
 
 server = Server("anti-slop-mcp")
 
+NON_LETTER = re.compile(r'[^a-z]+')
+VOWELS = frozenset('aeiouy')
+SENTENCE_END = re.compile(r'[.!?]+')
+SENTENCE_MARKS = str.maketrans('!?', '..')
+WHITESPACE_RUN = re.compile(r'\s+')
+WORD_CHAR = re.compile(r'\w')
+SPACE_BEFORE_PUNCT = re.compile(r'\s+([.,!?;:])')
+# The lookahead grabs the whole participle in one step and the lookbehind
+# checks its ending, so long words are never backtracked through
+PASSIVE_PATTERN = re.compile(
+    r'\b(?:is|are|was|were|be|been|being)\s+(?=(\w+))\1(?<=\w(?:ed|en))', re.IGNORECASE
+)
+EMOJI_PATTERN = re.compile(
+    "["
+    "\U0001F600-\U0001F64F"
+    "\U0001F300-\U0001F5FF"
+    "\U0001F680-\U0001F6FF"
+    "\U0001F700-\U0001F77F"
+    "\U0001F780-\U0001F7FF"
+    "\U0001F800-\U0001F8FF"
+    "\U0001F900-\U0001F9FF"
+    "\U0001FA00-\U0001FA6F"
+    "\U0001FA70-\U0001FAFF"
+    "\U00002600-\U000026FF"
+    "\U00002700-\U000027BF"
+    "\U0001F1E0-\U0001F1FF"
+    "]+",
+    flags=re.UNICODE
+)
+
+# Common words make up most of any text, so each distinct word is counted once
+@lru_cache(maxsize=16384)
 def count_syllables(word: str) -> int:
-    word = re.sub(r'[^a-z]', '', word.lower())
+    word = word.lower()
+    if not (word.isascii() and word.isalpha()):
+        word = NON_LETTER.sub('', word)
     if len(word) <= 3:
         return 1
-    word = re.sub(r'(?:[^laeiouy]es|ed|[^laeiouy]e)$', '', word)
-    word = re.sub(r'^y', '', word)
-    syllables = re.findall(r'[aeiouy]{1,2}', word)
-    return len(syllables) if syllables else 1
+    
+    # Silent endings: consonant + "es", "ed", or consonant + "e"
+    if word.endswith('es') and word[-3] not in 'laeiouy':
+        word = word[:-3]
+    elif word.endswith('ed'):
+        word = word[:-2]
+    elif word.endswith('e') and word[-2] not in 'laeiouy':
+        word = word[:-2]
+    if word.startswith('y'):
+        word = word[1:]
+    
+    # One syllable per started pair of vowels in each vowel run
+    syllables = 0
+    run = 0
+    for ch in word:
+        if ch in VOWELS:
+            run += 1
+            if run % 2:
+                syllables += 1
+        else:
+            run = 0
+    return syllables or 1
+
+def split_sentences(content: str) -> list[str]:
+    """Non-empty, stripped sentences split on runs of '.', '!' and '?'."""
+    if content.isascii():
+        # ASCII-to-ASCII translate and str.split both run in tight C loops;
+        # the empty pieces between repeated marks are dropped below
+        pieces = content.translate(SENTENCE_MARKS).split('.')
+    else:
+        # str.translate has no fast path for non-ASCII text, so use the regex
+        pieces = SENTENCE_END.split(content)
+    return [sentence for piece in pieces if (sentence := piece.strip())]
+
+class TextStats:
+    """Sentence and word splits of one text, each computed on first use.
+
+    Handlers get it through text_stats(), so a client calling several
+    analysis tools on the same text tokenizes it only once. The splits are
+    tuples because they are shared between calls.
+    """
+    
+    def __init__(self, content: str):
+        self.content = content
+    
+    @cached_property
+    def sentences(self) -> tuple[str, ...]:
+        return tuple(split_sentences(self.content))
+    
+    @cached_property
+    def sentence_word_counts(self) -> tuple[int, ...]:
+        return tuple(len(sentence.split()) for sentence in self.sentences)
+    
+    @cached_property
+    def words(self) -> tuple[str, ...]:
+        return tuple(self.content.split())
+    
+    @cached_property
+    def lower_words(self) -> tuple[str, ...]:
+        return tuple(word.lower() for word in self.words)
+    
+    @cached_property
+    def syllables(self) -> int:
+        # Each distinct word is counted once and weighted by how often it occurs
+        return sum(count_syllables(word) * n for word, n in Counter(self.words).items())
+
+# Longer texts are never held by the text_stats cache, which bounds its memory
+# by size as well as by entry count
+MAX_CACHED_CHARS = 200_000
+
+def text_stats(content: str) -> TextStats:
+    if len(content) > MAX_CACHED_CHARS:
+        return TextStats(content)
+    return _recent_text_stats(content)
+
+@lru_cache(maxsize=32)
+def _recent_text_stats(content: str) -> TextStats:
+    return TextStats(content)
+
+def top_repeated_phrases(
+    words, min_length: int, max_length: int = 5, top: int = 20
+) -> list[tuple[str, int]]:
+    """The most repeated phrases of min_length..max_length words, with their counts.
+
+    Each word gets an integer id, and an n-gram is encoded as the base-V number
+    of its ids (V = vocabulary size), extended one word at a time from the
+    codes of the shorter n-grams. The encoding is exact, so counting hashes
+    ints instead of joining a string per window; only the phrases that are
+    returned are decoded back to text. Ties keep first-seen order, shortest
+    phrases first. A min_length below 1 counts as 1: there are no empty phrases.
+    """
+    ids = {}
+    word_ids = [ids.setdefault(word, len(ids)) for word in words]
+    vocabulary = list(ids)
+    base = len(vocabulary) or 1
+    
+    repeated = []
+    codes = word_ids
+    for length in range(1, max_length + 1):
+        if length > 1:
+            codes = [code * base + word_id for code, word_id in zip(codes, word_ids[length - 1:])]
+        if length >= min_length:
+            repeated.extend(
+                (length, code, count) for code, count in Counter(codes).items() if count > 1
+            )
+    
+    # nlargest is a stable partial sort, so it keeps the same ties as a full sort
+    phrases = []
+    for length, code, count in heapq.nlargest(top, repeated, key=itemgetter(2)):
+        parts = []
+        for _ in range(length):
+            code, word_id = divmod(code, base)
+            parts.append(vocabulary[word_id])
+        phrases.append((' '.join(reversed(parts)), count))
+    return phrases
 
 def get_reading_difficulty(flesch_score: float) -> str:
     if flesch_score >= 90:
@@ -41,180 +198,305 @@ def get_reading_difficulty(flesch_score: float) -> str:
         return 'Difficult'
     return 'Very Difficult'
 
-@server.list_tools()
-async def handle_list_tools() -> list[types.Tool]:
-    return [
-        types.Tool(
-            name="analyze_content_for_slop",
-            description="Analyze text for low-quality AI-generated content. Returns a score (0-10) where higher means more slop, plus specific issues and suggestions.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "content": {"type": "string", "description": "The text to analyze"}
-                },
-                "required": ["content"]
-            }
-        ),
-        types.Tool(
-            name="detect_ai_phrases",
-            description="Detect common AI-generated phrases like 'delve into', 'it's worth noting', 'in today's world', etc.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "content": {"type": "string", "description": "The text to scan for AI phrases"}
-                },
-                "required": ["content"]
-            }
-        ),
-        types.Tool(
-            name="remove_filler_words",
-            description="Remove filler words like 'actually', 'basically', 'literally', 'just', 'very', 'really', etc.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "content": {"type": "string", "description": "The text to clean"}
-                },
-                "required": ["content"]
-            }
-        ),
-        types.Tool(
-            name="detect_cliches",
-            description="Detect business clichés and buzzwords like 'game changer', 'synergy', 'low-hanging fruit', etc.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "content": {"type": "string", "description": "The text to scan for clichés"}
-                },
-                "required": ["content"]
-            }
-        ),
-        types.Tool(
-            name="remove_hedging",
-            description="Remove hedging language like 'perhaps', 'maybe', 'might', 'it seems', etc. to make text more direct.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "content": {"type": "string", "description": "The text to clean"}
-                },
-                "required": ["content"]
-            }
-        ),
-        types.Tool(
-            name="detect_passive_voice",
-            description="Detect passive voice usage in text and calculate percentage of passive sentences.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "content": {"type": "string", "description": "The text to analyze"}
-                },
-                "required": ["content"]
-            }
-        ),
-        types.Tool(
-            name="calculate_readability",
-            description="Calculate Flesch reading ease score, grade level, and other readability metrics.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "content": {"type": "string", "description": "The text to analyze"}
-                },
-                "required": ["content"]
-            }
-        ),
-        types.Tool(
-            name="detect_repetition",
-            description="Find repeated phrases in text (helps identify redundant content).",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "content": {"type": "string", "description": "The text to scan"},
-                    "min_length": {"type": "integer", "description": "Minimum phrase length to detect (default: 3)", "default": 3}
-                },
-                "required": ["content"]
-            }
-        ),
-        types.Tool(
-            name="detect_run_on_sentences",
-            description="Detect overly long run-on sentences that should be split.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "content": {"type": "string", "description": "The text to analyze"},
-                    "max_words": {"type": "integer", "description": "Maximum words per sentence (default: 30)", "default": 30}
-                },
-                "required": ["content"]
-            }
-        ),
-        types.Tool(
-            name="remove_redundancies",
-            description="Remove redundant phrases like 'past history', 'future plans', 'absolutely essential', etc.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "content": {"type": "string", "description": "The text to clean"}
-                },
-                "required": ["content"]
-            }
-        ),
-        types.Tool(
-            name="improve_content_from_slop",
-            description="Use AI to rewrite text, removing slop and improving clarity while preserving meaning.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "content": {"type": "string", "description": "The text to improve"},
-                    "preserve_meaning": {"type": "boolean", "description": "Preserve original meaning (default: true)", "default": True},
-                    "target_tone": {"type": "string", "description": "Target tone (default: 'professional')", "default": "professional"}
-                },
-                "required": ["content"]
-            }
-        ),
-        types.Tool(
-            name="remove_emojis",
-            description="Remove all emojis from text.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "content": {"type": "string", "description": "The text to clean"}
-                },
-                "required": ["content"]
-            }
-        ),
-        types.Tool(
-            name="normalize_whitespace",
-            description="Normalize whitespace, removing extra spaces, tabs, and blank lines.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "content": {"type": "string", "description": "The text to normalize"}
-                },
-                "required": ["content"]
-            }
-        )
-    ]
+def word_pattern(phrase: str) -> re.Pattern:
+    return re.compile(r'\b' + re.escape(phrase) + r'\b', re.IGNORECASE)
 
-@server.call_tool()
-async def handle_call_tool(
-    name: str, arguments: dict | None
-) -> list[types.TextContent | types.ImageContent | types.EmbeddedResource]:
+def is_word_prefix(short: str, phrase: str) -> bool:
+    """Whether short matches wherever phrase does: a prefix ending at a word boundary."""
+    if len(short) >= len(phrase) or phrase[:len(short)].lower() != short.lower():
+        return False
+    return bool(WORD_CHAR.match(phrase[len(short) - 1])) != bool(WORD_CHAR.match(phrase[len(short)]))
+
+class PhraseScanner:
+    """Count occurrences of many phrases in one case-insensitive pass over the text.
+
+    Counts equal those of searching for each whole phrase on its own. The
+    alternation sits in a zero-width lookahead, so overlapping phrases are
+    all found; at each position the longest phrase is tried first, and the
+    shorter phrases it starts with (like 'might' in 'might possibly') are
+    counted along with it. Like a search for one phrase, a phrase found
+    again before its previous match ends ('win-win' in 'win-win-win') is
+    not counted twice.
+    """
     
-    if not arguments:
-        raise ValueError("Missing arguments")
+    def __init__(self, phrases):
+        ordered = sorted(phrases, key=len, reverse=True)
+        alternation = '|'.join(f'({re.escape(phrase)})' for phrase in ordered)
+        self.pattern = re.compile(r'(?=\b(?:' + alternation + r')\b)', re.IGNORECASE)
+        # Indexed by capture group: the phrases found when that group matches
+        self.matched_with = [()] + [
+            (phrase,) + tuple(short for short in phrases if is_word_prefix(short, phrase))
+            for phrase in ordered
+        ]
     
-    content = arguments.get("content", "")
+    def count(self, content: str) -> Counter:
+        counts = Counter()
+        next_start = {}
+        for match in self.pattern.finditer(content):
+            start = match.start()
+            for phrase in self.matched_with[match.lastindex]:
+                if start >= next_start.get(phrase, 0):
+                    counts[phrase] += 1
+                    next_start[phrase] = start + len(phrase)
+        return counts
+
+AI_PHRASES = (
+    'delve into', 'delve deeper', 'delving into',
+    "it's worth noting", 'worth noting that',
+    "in today's world", "in today's landscape", "in today's digital age",
+    'navigate the complexities', 'navigating the complexities',
+    'at the end of the day',
+    "it's important to note",
+    'plays a crucial role',
+    'robust solution', 'robust framework',
+    'holistic approach', 'holistic view',
+    'leverage', 'leveraging',
+    'synergy', 'synergistic',
+    'paradigm shift',
+    'game changer', 'game-changer',
+    'disrupt', 'disruptive',
+    'cutting-edge', 'cutting edge',
+    'state-of-the-art', 'state of the art',
+    'best practices',
+    'deep dive', 'deep-dive',
+    'unpack', "let's unpack",
+    'double down',
+    'circle back',
+    'move the needle',
+    'low-hanging fruit',
+    'on the same page',
+    'think outside the box',
+    'push the envelope',
+    'touch base'
+)
+AI_PHRASE_SCAN = PhraseScanner(AI_PHRASES)
+
+FILLER_WORDS = ('actually', 'basically', 'literally', 'just', 'very', 'really', 'quite', 'rather', 'somewhat', 'perhaps', 'maybe')
+# One group per word, so a match's lastindex names the word whatever its case
+FILLER_PATTERN = re.compile(
+    r'\b(?:' + '|'.join(f'({re.escape(word)})' for word in FILLER_WORDS) + r')\b', re.IGNORECASE
+)
+# A run of whitespace and filler words, which cleans up to one space or none.
+# A lone space that stays as it is (not before punctuation, whitespace or a
+# filler word) is skipped, so ordinary prose costs no callback per word.
+_FILLER_ALT = '|'.join(map(re.escape, FILLER_WORDS))
+FILLER_RUN = re.compile(
+    rf'(?! (?![\s.,!?;:]|(?:{_FILLER_ALT})\b))(?:\s+|\b(?:{_FILLER_ALT})\b)+', re.IGNORECASE
+)
+
+CLICHES = (
+    'at the end of the day', 'think outside the box', 'game changer',
+    'low-hanging fruit', 'move the needle', 'paradigm shift',
+    'synergy', 'win-win', 'touch base', 'circle back',
+    'take it to the next level', 'best of breed', 'industry leading',
+    'world class', 'bleeding edge', 'mission critical',
+    'seamless integration', 'turnkey solution', 'value add',
+    'best in class', 'drill down', 'bandwidth',
+    'actionable insights', 'core competency'
+)
+CLICHE_SCAN = PhraseScanner(CLICHES)
+
+HEDGE_PHRASES = (
+    'it seems', 'it appears', 'it might be', 'it could be',
+    'perhaps', 'maybe', 'possibly', 'probably',
+    'might', 'could', 'may', 'would seem',
+    'in some ways', 'to some extent', 'sort of', 'kind of',
+    'I think', 'I believe', 'I feel',
+    'somewhat', 'fairly', 'relatively',
+    'could potentially', 'might possibly'
+)
+HEDGE_SCAN = PhraseScanner(HEDGE_PHRASES)
+HEDGE_PATTERNS = {phrase: word_pattern(phrase) for phrase in HEDGE_PHRASES}
+
+REDUNDANCIES = (
+    {'phrase': 'absolutely essential', 'replacement': 'essential'},
+    {'phrase': 'absolutely necessary', 'replacement': 'necessary'},
+    {'phrase': 'added bonus', 'replacement': 'bonus'},
+    {'phrase': 'advance planning', 'replacement': 'planning'},
+    {'phrase': 'already existing', 'replacement': 'existing'},
+    {'phrase': 'basic fundamentals', 'replacement': 'fundamentals'},
+    {'phrase': 'close proximity', 'replacement': 'proximity'},
+    {'phrase': 'completely eliminate', 'replacement': 'eliminate'},
+    {'phrase': 'end result', 'replacement': 'result'},
+    {'phrase': 'final outcome', 'replacement': 'outcome'},
+    {'phrase': 'free gift', 'replacement': 'gift'},
+    {'phrase': 'future plans', 'replacement': 'plans'},
+    {'phrase': 'past history', 'replacement': 'history'},
+    {'phrase': 'personal opinion', 'replacement': 'opinion'},
+    {'phrase': 'true fact', 'replacement': 'fact'},
+    {'phrase': 'unexpected surprise', 'replacement': 'surprise'}
+)
+REDUNDANCY_SCAN = PhraseScanner([item['phrase'] for item in REDUNDANCIES])
+REDUNDANCY_PATTERNS = {item['phrase']: word_pattern(item['phrase']) for item in REDUNDANCIES}
+
+# The tool definitions never change, so they are built once rather than per request
+_TOOLS = [
+    types.Tool(
+        name="analyze_content_for_slop",
+        description="Analyze text for low-quality AI-generated content. Returns a score (0-10) where higher means more slop, plus specific issues and suggestions.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "content": {"type": "string", "description": "The text to analyze"}
+            },
+            "required": ["content"]
+        }
+    ),
+    types.Tool(
+        name="detect_ai_phrases",
+        description="Detect common AI-generated phrases like 'delve into', 'it's worth noting', 'in today's world', etc.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "content": {"type": "string", "description": "The text to scan for AI phrases"}
+            },
+            "required": ["content"]
+        }
+    ),
+    types.Tool(
+        name="remove_filler_words",
+        description="Remove filler words like 'actually', 'basically', 'literally', 'just', 'very', 'really', etc.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "content": {"type": "string", "description": "The text to clean"}
+            },
+            "required": ["content"]
+        }
+    ),
+    types.Tool(
+        name="detect_cliches",
+        description="Detect business clichés and buzzwords like 'game changer', 'synergy', 'low-hanging fruit', etc.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "content": {"type": "string", "description": "The text to scan for clichés"}
+            },
+            "required": ["content"]
+        }
+    ),
+    types.Tool(
+        name="remove_hedging",
+        description="Remove hedging language like 'perhaps', 'maybe', 'might', 'it seems', etc. to make text more direct.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "content": {"type": "string", "description": "The text to clean"}
+            },
+            "required": ["content"]
+        }
+    ),
+    types.Tool(
+        name="detect_passive_voice",
+        description="Detect passive voice usage in text and calculate percentage of passive sentences.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "content": {"type": "string", "description": "The text to analyze"}
+            },
+            "required": ["content"]
+        }
+    ),
+    types.Tool(
+        name="calculate_readability",
+        description="Calculate Flesch reading ease score, grade level, and other readability metrics.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "content": {"type": "string", "description": "The text to analyze"}
+            },
+            "required": ["content"]
+        }
+    ),
+    types.Tool(
+        name="detect_repetition",
+        description="Find repeated phrases in text (helps identify redundant content).",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "content": {"type": "string", "description": "The text to scan"},
+                "min_length": {"type": "integer", "description": "Minimum phrase length to detect (default: 3)", "default": 3}
+            },
+            "required": ["content"]
+        }
+    ),
+    types.Tool(
+        name="detect_run_on_sentences",
+        description="Detect overly long run-on sentences that should be split.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "content": {"type": "string", "description": "The text to analyze"},
+                "max_words": {"type": "integer", "description": "Maximum words per sentence (default: 30)", "default": 30}
+            },
+            "required": ["content"]
+        }
+    ),
+    types.Tool(
+        name="remove_redundancies",
+        description="Remove redundant phrases like 'past history', 'future plans', 'absolutely essential', etc.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "content": {"type": "string", "description": "The text to clean"}
+            },
+            "required": ["content"]
+        }
+    ),
+    types.Tool(
+        name="improve_content_from_slop",
+        description="Use AI to rewrite text, removing slop and improving clarity while preserving meaning.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "content": {"type": "string", "description": "The text to improve"},
+                "preserve_meaning": {"type": "boolean", "description": "Preserve original meaning (default: true)", "default": True},
+                "target_tone": {"type": "string", "description": "Target tone (default: 'professional')", "default": "professional"}
+            },
+            "required": ["content"]
+        }
+    ),
+    types.Tool(
+        name="remove_emojis",
+        description="Remove all emojis from text.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "content": {"type": "string", "description": "The text to clean"}
+            },
+            "required": ["content"]
+        }
+    ),
+    types.Tool(
+        name="normalize_whitespace",
+        description="Normalize whitespace, removing extra spaces, tabs, and blank lines.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "content": {"type": "string", "description": "The text to normalize"}
+            },
+            "required": ["content"]
+        }
+    )
+]
+
+@server.list_tools()
+async def handle_list_tools() -> list[types.Tool]:
+    return _TOOLS
+
+async def _tool_analyze_content_for_slop(content: str, arguments: dict) -> list[types.TextContent]:
+    client = get_client()
+    if not client:
+        return [types.TextContent(type="text", text="Error: OpenAI API key not configured. Set OPENAI_API_KEY environment variable.")]
     
-    if name == "analyze_content_for_slop":
-        if not client:
-            return [types.TextContent(type="text", text="Error: OpenAI API key not configured. Set OPENAI_API_KEY environment variable.")]
-        
-        try:
-            completion = client.chat.completions.create(
-                model="gpt-4",
-                messages=[
-                    {
-                        "role": "system",
-                        "content": """You are a content quality analyzer. Analyze the given text for "slop" - low-quality, repetitive, generic, or unnecessarily verbose AI-generated content. 
-                        
+    try:
+        completion = client.chat.completions.create(
+            model="gpt-4",
+            messages=[
+                {
+                    "role": "system",
+                    "content": """You are a content quality analyzer. Analyze the given text for "slop" - low-quality, repetitive, generic, or unnecessarily verbose AI-generated content. 
+                    
 Rate the content on a scale of 0-10 where:
 - 0-3: High quality, concise, specific content
 - 4-6: Moderate quality with some generic phrases
@@ -224,20 +506,19 @@ Provide a JSON response with:
 - score (0-10)
 - issues (array of specific problems found)
 - suggestions (array of improvement recommendations)"""
-                    },
-                    {
-                        "role": "user",
-                        "content": f"Analyze this content:\n\n{content}"
-                    }
-                ],
-                temperature=0.3,
-                response_format={"type": "json_object"}
-            )
-            
-            import json
-            analysis = json.loads(completion.choices[0].message.content)
-            
-            result = f"""Analysis Results:
+                },
+                {
+                    "role": "user",
+                    "content": f"Analyze this content:\n\n{content}"
+                }
+            ],
+            temperature=0.3,
+            response_format={"type": "json_object"}
+        )
+        
+        analysis = json.loads(completion.choices[0].message.content)
+        
+        result = f"""Analysis Results:
 Score: {analysis.get('score', 0)}/10
 
 Issues Found:
@@ -245,174 +526,129 @@ Issues Found:
 
 Suggestions:
 {chr(10).join('- ' + suggestion for suggestion in analysis.get('suggestions', []))}"""
-            
-            return [types.TextContent(type="text", text=result)]
-        except Exception as e:
-            return [types.TextContent(type="text", text=f"Error analyzing content: {str(e)}")]
-    
-    elif name == "detect_ai_phrases":
-        ai_phrases = [
-            'delve into', 'delve deeper', 'delving into',
-            "it's worth noting", 'worth noting that',
-            "in today's world", "in today's landscape", "in today's digital age",
-            'navigate the complexities', 'navigating the complexities',
-            'at the end of the day',
-            "it's important to note",
-            'plays a crucial role',
-            'robust solution', 'robust framework',
-            'holistic approach', 'holistic view',
-            'leverage', 'leveraging',
-            'synergy', 'synergistic',
-            'paradigm shift',
-            'game changer', 'game-changer',
-            'disrupt', 'disruptive',
-            'cutting-edge', 'cutting edge',
-            'state-of-the-art', 'state of the art',
-            'best practices',
-            'deep dive', 'deep-dive',
-            'unpack', "let's unpack",
-            'double down',
-            'circle back',
-            'move the needle',
-            'low-hanging fruit',
-            'on the same page',
-            'think outside the box',
-            'push the envelope',
-            'touch base'
-        ]
-        
-        found = []
-        for phrase in ai_phrases:
-            pattern = re.compile(r'\b' + re.escape(phrase) + r'\b', re.IGNORECASE)
-            matches = pattern.findall(content)
-            if matches:
-                found.append(f"'{phrase}' - found {len(matches)} time(s)")
-        
-        slop_score = min(10, len(found) * 2)
-        
-        if found:
-            result = f"AI Phrases Detected: {len(found)}\nSlop Score: {slop_score}/10\n\n" + "\n".join(found)
-        else:
-            result = "No AI phrases detected. Content looks clean!"
         
         return [types.TextContent(type="text", text=result)]
+    except Exception as e:
+        return [types.TextContent(type="text", text=f"Error analyzing content: {str(e)}")]
+
+async def _tool_detect_ai_phrases(content: str, arguments: dict) -> list[types.TextContent]:
+    counts = AI_PHRASE_SCAN.count(content)
+    found = [
+        f"'{phrase}' - found {counts[phrase]} time(s)"
+        for phrase in AI_PHRASES
+        if phrase in counts
+    ]
     
-    elif name == "remove_filler_words":
-        filler_words = ['actually', 'basically', 'literally', 'just', 'very', 'really', 'quite', 'rather', 'somewhat', 'perhaps', 'maybe']
-        found = {}
-        cleaned = content
-        
-        for word in filler_words:
-            pattern = re.compile(r'\b' + word + r'\b', re.IGNORECASE)
-            matches = pattern.findall(content)
-            if matches:
-                found[word] = len(matches)
-                cleaned = pattern.sub('', cleaned)
-        
-        cleaned = re.sub(r'\s+', ' ', cleaned)
-        cleaned = re.sub(r'\s+([.,!?;:])', r'\1', cleaned).strip()
-        
-        result = f"Cleaned Content:\n{cleaned}\n\nRemoved {sum(found.values())} filler words"
-        if found:
-            result += ":\n" + "\n".join(f"- {word}: {count}" for word, count in found.items())
-        
-        return [types.TextContent(type="text", text=result)]
+    slop_score = min(10, len(found) * 2)
     
-    elif name == "detect_cliches":
-        cliches = [
-            'at the end of the day', 'think outside the box', 'game changer',
-            'low-hanging fruit', 'move the needle', 'paradigm shift',
-            'synergy', 'win-win', 'touch base', 'circle back',
-            'take it to the next level', 'best of breed', 'industry leading',
-            'world class', 'bleeding edge', 'mission critical',
-            'seamless integration', 'turnkey solution', 'value add',
-            'best in class', 'drill down', 'bandwidth',
-            'actionable insights', 'core competency'
-        ]
-        
-        found = []
-        for cliche in cliches:
-            pattern = re.compile(r'\b' + re.escape(cliche) + r'\b', re.IGNORECASE)
-            matches = pattern.findall(content)
-            if matches:
-                found.append(f"'{cliche}' - {len(matches)} time(s)")
-        
-        if found:
-            result = f"Clichés Detected: {len(found)}\n\n" + "\n".join(found)
-        else:
-            result = "No clichés detected!"
-        
-        return [types.TextContent(type="text", text=result)]
+    if found:
+        result = f"AI Phrases Detected: {len(found)}\nSlop Score: {slop_score}/10\n\n" + "\n".join(found)
+    else:
+        result = "No AI phrases detected. Content looks clean!"
     
-    elif name == "remove_hedging":
-        hedge_phrases = [
-            'it seems', 'it appears', 'it might be', 'it could be',
-            'perhaps', 'maybe', 'possibly', 'probably',
-            'might', 'could', 'may', 'would seem',
-            'in some ways', 'to some extent', 'sort of', 'kind of',
-            'I think', 'I believe', 'I feel',
-            'somewhat', 'fairly', 'relatively',
-            'could potentially', 'might possibly'
-        ]
-        
-        found = {}
-        cleaned = content
-        
-        for phrase in hedge_phrases:
-            pattern = re.compile(r'\b' + re.escape(phrase) + r'\b', re.IGNORECASE)
-            matches = pattern.findall(content)
-            if matches:
-                found[phrase] = len(matches)
-                cleaned = pattern.sub('', cleaned)
-        
-        cleaned = re.sub(r'\s+', ' ', cleaned)
-        cleaned = re.sub(r'\s+([.,!?;:])', r'\1', cleaned).strip()
-        
-        result = f"Cleaned Content:\n{cleaned}\n\nRemoved {sum(found.values())} hedging phrases"
-        if found:
-            result += ":\n" + "\n".join(f"- '{phrase}': {count}" for phrase, count in found.items())
-        
-        return [types.TextContent(type="text", text=result)]
+    return [types.TextContent(type="text", text=result)]
+
+async def _tool_remove_filler_words(content: str, arguments: dict) -> list[types.TextContent]:
+    # Filler removal, whitespace collapsing and dropping spaces before
+    # punctuation happen in one pass over the runs; the words never overlap,
+    # and each one removed is recorded by its group index
+    matched = []
     
-    elif name == "detect_passive_voice":
-        passive_patterns = [
-            re.compile(r'\b(is|are|was|were|be|been|being)\s+\w+ed\b', re.IGNORECASE),
-            re.compile(r'\b(is|are|was|were|be|been|being)\s+\w+en\b', re.IGNORECASE)
-        ]
-        
-        matches = []
-        for pattern in passive_patterns:
-            found = pattern.findall(content)
-            matches.extend(found)
-        
-        sentences = [s.strip() for s in re.split(r'[.!?]+', content) if s.strip()]
-        passive_sentences = [s for s in sentences if any(p.search(s) for p in passive_patterns)]
-        
-        percentage = round((len(passive_sentences) / len(sentences)) * 100) if sentences else 0
-        
-        result = f"""Passive Voice Analysis:
+    def record(m: re.Match) -> str:
+        matched.append(m.lastindex)
+        return ''
+    
+    def clean_run(m: re.Match) -> str:
+        run = m.group()
+        if not run.isspace():
+            run = FILLER_PATTERN.sub(record, run)
+        end = m.end()
+        if not run or end < len(content) and content[end] in '.,!?;:':
+            return ''
+        return ' '
+    
+    cleaned = FILLER_RUN.sub(clean_run, content).strip()
+    counts = Counter(matched)
+    found = {word: counts[i] for i, word in enumerate(FILLER_WORDS, 1) if i in counts}
+    
+    result = f"Cleaned Content:\n{cleaned}\n\nRemoved {sum(found.values())} filler words"
+    if found:
+        result += ":\n" + "\n".join(f"- {word}: {count}" for word, count in found.items())
+    
+    return [types.TextContent(type="text", text=result)]
+
+async def _tool_detect_cliches(content: str, arguments: dict) -> list[types.TextContent]:
+    counts = CLICHE_SCAN.count(content)
+    found = [
+        f"'{cliche}' - {counts[cliche]} time(s)"
+        for cliche in CLICHES
+        if cliche in counts
+    ]
+    
+    if found:
+        result = f"Clichés Detected: {len(found)}\n\n" + "\n".join(found)
+    else:
+        result = "No clichés detected!"
+    
+    return [types.TextContent(type="text", text=result)]
+
+async def _tool_remove_hedging(content: str, arguments: dict) -> list[types.TextContent]:
+    counts = HEDGE_SCAN.count(content)
+    found = {phrase: counts[phrase] for phrase in HEDGE_PHRASES if phrase in counts}
+    cleaned = content
+    
+    # Only phrases present in the original are removed, still in list order
+    for phrase in found:
+        cleaned = HEDGE_PATTERNS[phrase].sub('', cleaned)
+    
+    cleaned = WHITESPACE_RUN.sub(' ', cleaned)
+    cleaned = SPACE_BEFORE_PUNCT.sub(r'\1', cleaned).strip()
+    
+    result = f"Cleaned Content:\n{cleaned}\n\nRemoved {sum(found.values())} hedging phrases"
+    if found:
+        result += ":\n" + "\n".join(f"- '{phrase}': {count}" for phrase, count in found.items())
+    
+    return [types.TextContent(type="text", text=result)]
+
+async def _tool_detect_passive_voice(content: str, arguments: dict) -> list[types.TextContent]:
+    sentences = text_stats(content).sentences
+    
+    # One pass over the whole text; a match never spans '.', '!' or '?', so
+    # one between two matches means the second is in a new sentence
+    matches = 0
+    passive_sentences = 0
+    last_end = None
+    for match in PASSIVE_PATTERN.finditer(content):
+        matches += 1
+        if last_end is None or SENTENCE_END.search(content, last_end, match.start()):
+            passive_sentences += 1
+        last_end = match.end()
+    
+    percentage = round((passive_sentences / len(sentences)) * 100) if sentences else 0
+    
+    result = f"""Passive Voice Analysis:
 Total Sentences: {len(sentences)}
-Passive Sentences: {len(passive_sentences)} ({percentage}%)
-Passive Phrases Found: {len(matches)}
+Passive Sentences: {passive_sentences} ({percentage}%)
+Passive Phrases Found: {matches}
 
 Recommendation: {"Consider rewriting in active voice" if percentage > 20 else "Passive voice usage is acceptable"}"""
-        
-        return [types.TextContent(type="text", text=result)]
     
-    elif name == "calculate_readability":
-        sentences = len([s for s in re.split(r'[.!?]+', content) if s.strip()])
-        words_list = [w for w in content.split() if w.strip()]
-        words = len(words_list)
-        syllables = sum(count_syllables(word) for word in words_list)
-        
-        avg_sentence_length = words / sentences if sentences > 0 else 0
-        avg_syllables_per_word = syllables / words if words > 0 else 0
-        
-        flesch_score = 206.835 - 1.015 * avg_sentence_length - 84.6 * avg_syllables_per_word
-        flesch_score = max(0, min(100, flesch_score))
-        grade_level = max(0, 0.39 * avg_sentence_length + 11.8 * avg_syllables_per_word - 15.59)
-        
-        result = f"""Readability Analysis:
+    return [types.TextContent(type="text", text=result)]
+
+async def _tool_calculate_readability(content: str, arguments: dict) -> list[types.TextContent]:
+    stats = text_stats(content)
+    sentences = len(stats.sentences)
+    words = len(stats.words)
+    syllables = stats.syllables
+    
+    avg_sentence_length = words / sentences if sentences > 0 else 0
+    avg_syllables_per_word = syllables / words if words > 0 else 0
+    
+    flesch_score = 206.835 - 1.015 * avg_sentence_length - 84.6 * avg_syllables_per_word
+    flesch_score = max(0, min(100, flesch_score))
+    grade_level = max(0, 0.39 * avg_sentence_length + 11.8 * avg_syllables_per_word - 15.59)
+    
+    result = f"""Readability Analysis:
 Flesch Reading Ease: {round(flesch_score)}/100
 Difficulty: {get_reading_difficulty(flesch_score)}
 Grade Level: {round(grade_level, 1)}
@@ -423,115 +659,87 @@ Statistics:
 - Syllables: {syllables}
 - Avg Sentence Length: {round(avg_sentence_length, 1)} words
 - Avg Syllables per Word: {round(avg_syllables_per_word, 1)}"""
-        
-        return [types.TextContent(type="text", text=result)]
     
-    elif name == "detect_repetition":
-        min_length = arguments.get("min_length", 3)
-        words = [w.lower() for w in content.split() if w.strip()]
-        phrases = {}
-        
-        for length in range(min_length, 6):
-            for i in range(len(words) - length + 1):
-                phrase = ' '.join(words[i:i + length])
-                phrases[phrase] = phrases.get(phrase, 0) + 1
-        
-        repeated = [
-            (phrase, count)
-            for phrase, count in phrases.items()
-            if count > 1
-        ]
-        repeated.sort(key=lambda x: x[1], reverse=True)
-        repeated = repeated[:20]
-        
-        if repeated:
-            result = f"Repeated Phrases Found: {len(repeated)}\n\n" + "\n".join(
-                f"'{phrase}' - {count} times" for phrase, count in repeated
-            )
-        else:
-            result = "No significant repetition detected."
-        
-        return [types.TextContent(type="text", text=result)]
+    return [types.TextContent(type="text", text=result)]
+
+async def _tool_detect_repetition(content: str, arguments: dict) -> list[types.TextContent]:
+    min_length = arguments.get("min_length", 3)
+    words = text_stats(content).lower_words
+    repeated = top_repeated_phrases(words, min_length)
     
-    elif name == "detect_run_on_sentences":
-        max_words = arguments.get("max_words", 30)
-        sentences = [s.strip() for s in re.split(r'[.!?]+', content) if s.strip()]
-        
-        run_on_sentences = [
-            (sentence, len(sentence.split()))
-            for sentence in sentences
-            if len(sentence.split()) > max_words
-        ]
-        
-        percentage = round((len(run_on_sentences) / len(sentences)) * 100) if sentences else 0
-        
-        result = f"""Run-on Sentence Analysis:
+    if repeated:
+        result = f"Repeated Phrases Found: {len(repeated)}\n\n" + "\n".join(
+            f"'{phrase}' - {count} times" for phrase, count in repeated
+        )
+    else:
+        result = "No significant repetition detected."
+    
+    return [types.TextContent(type="text", text=result)]
+
+async def _tool_detect_run_on_sentences(content: str, arguments: dict) -> list[types.TextContent]:
+    max_words = arguments.get("max_words", 30)
+    stats = text_stats(content)
+    sentences = stats.sentences
+    
+    # One pass that counts every run-on but only keeps the five that are shown;
+    # the word counts are cached with the text, so other thresholds reuse them
+    run_on_count = 0
+    shown = []
+    for sentence, word_count in zip(sentences, stats.sentence_word_counts):
+        if word_count > max_words:
+            run_on_count += 1
+            if len(shown) < 5:
+                shown.append(f"- {word_count} words: {sentence[:100]}...")
+    
+    percentage = round((run_on_count / len(sentences)) * 100) if sentences else 0
+    
+    result = f"""Run-on Sentence Analysis:
 Total Sentences: {len(sentences)}
-Run-on Sentences: {len(run_on_sentences)} ({percentage}%)
+Run-on Sentences: {run_on_count} ({percentage}%)
 Threshold: {max_words} words
 
 """
-        if run_on_sentences:
-            result += "Run-on sentences found:\n" + "\n".join(
-                f"- {word_count} words: {sentence[:100]}..." for sentence, word_count in run_on_sentences[:5]
-            )
-        else:
-            result += "No run-on sentences detected!"
-        
-        return [types.TextContent(type="text", text=result)]
+    if shown:
+        result += "Run-on sentences found:\n" + "\n".join(shown)
+    else:
+        result += "No run-on sentences detected!"
     
-    elif name == "remove_redundancies":
-        redundancies = [
-            {'phrase': 'absolutely essential', 'replacement': 'essential'},
-            {'phrase': 'absolutely necessary', 'replacement': 'necessary'},
-            {'phrase': 'added bonus', 'replacement': 'bonus'},
-            {'phrase': 'advance planning', 'replacement': 'planning'},
-            {'phrase': 'already existing', 'replacement': 'existing'},
-            {'phrase': 'basic fundamentals', 'replacement': 'fundamentals'},
-            {'phrase': 'close proximity', 'replacement': 'proximity'},
-            {'phrase': 'completely eliminate', 'replacement': 'eliminate'},
-            {'phrase': 'end result', 'replacement': 'result'},
-            {'phrase': 'final outcome', 'replacement': 'outcome'},
-            {'phrase': 'free gift', 'replacement': 'gift'},
-            {'phrase': 'future plans', 'replacement': 'plans'},
-            {'phrase': 'past history', 'replacement': 'history'},
-            {'phrase': 'personal opinion', 'replacement': 'opinion'},
-            {'phrase': 'true fact', 'replacement': 'fact'},
-            {'phrase': 'unexpected surprise', 'replacement': 'surprise'}
-        ]
-        
-        cleaned = content
-        found = []
-        
-        for item in redundancies:
-            pattern = re.compile(r'\b' + re.escape(item['phrase']) + r'\b', re.IGNORECASE)
-            matches = pattern.findall(content)
-            if matches:
-                found.append(f"'{item['phrase']}' → '{item['replacement']}' ({len(matches)} times)")
-                cleaned = pattern.sub(item['replacement'], cleaned)
-        
-        result = f"Cleaned Content:\n{cleaned}\n\n"
-        if found:
-            result += f"Removed {len(found)} redundancies:\n" + "\n".join(found)
-        else:
-            result += "No redundancies found!"
-        
-        return [types.TextContent(type="text", text=result)]
+    return [types.TextContent(type="text", text=result)]
+
+async def _tool_remove_redundancies(content: str, arguments: dict) -> list[types.TextContent]:
+    counts = REDUNDANCY_SCAN.count(content)
+    cleaned = content
+    found = []
     
-    elif name == "improve_content_from_slop":
-        if not client:
-            return [types.TextContent(type="text", text="Error: OpenAI API key not configured. Set OPENAI_API_KEY environment variable.")]
-        
-        preserve_meaning = arguments.get("preserve_meaning", True)
-        target_tone = arguments.get("target_tone", "professional")
-        
-        try:
-            completion = client.chat.completions.create(
-                model="gpt-4",
-                messages=[
-                    {
-                        "role": "system",
-                        "content": f"""You are a content improvement specialist. Rewrite the given text to remove "slop" while {'preserving the original meaning' if preserve_meaning else 'focusing on clarity'}. 
+    for item in REDUNDANCIES:
+        phrase, replacement = item['phrase'], item['replacement']
+        if phrase in counts:
+            found.append(f"'{phrase}' → '{replacement}' ({counts[phrase]} times)")
+            cleaned = REDUNDANCY_PATTERNS[phrase].sub(replacement, cleaned)
+    
+    result = f"Cleaned Content:\n{cleaned}\n\n"
+    if found:
+        result += f"Removed {len(found)} redundancies:\n" + "\n".join(found)
+    else:
+        result += "No redundancies found!"
+    
+    return [types.TextContent(type="text", text=result)]
+
+async def _tool_improve_content_from_slop(content: str, arguments: dict) -> list[types.TextContent]:
+    client = get_client()
+    if not client:
+        return [types.TextContent(type="text", text="Error: OpenAI API key not configured. Set OPENAI_API_KEY environment variable.")]
+    
+    preserve_meaning = arguments.get("preserve_meaning", True)
+    target_tone = arguments.get("target_tone", "professional")
+    
+    try:
+        completion = client.chat.completions.create(
+            model="gpt-4",
+            messages=[
+                {
+                    "role": "system",
+                    "content": f"""You are a content improvement specialist. Rewrite the given text to remove "slop" while {'preserving the original meaning' if preserve_meaning else 'focusing on clarity'}. 
 
 Remove:
 - Unnecessary qualifiers and hedging language
@@ -551,74 +759,91 @@ Return a JSON response with:
 - changes_made (array describing what was improved)
 - original_word_count
 - new_word_count"""
-                    },
-                    {
-                        "role": "user",
-                        "content": f"Improve this content:\n\n{content}"
-                    }
-                ],
-                temperature=0.5,
-                response_format={"type": "json_object"}
-            )
-            
-            import json
-            result_data = json.loads(completion.choices[0].message.content)
-            
-            result = f"""Improved Content:
+                },
+                {
+                    "role": "user",
+                    "content": f"Improve this content:\n\n{content}"
+                }
+            ],
+            temperature=0.5,
+            response_format={"type": "json_object"}
+        )
+        
+        result_data = json.loads(completion.choices[0].message.content)
+        
+        result = f"""Improved Content:
 {result_data.get('improved_content', content)}
 
 Changes Made:
 {chr(10).join('- ' + change for change in result_data.get('changes_made', []))}
 
 Word Count: {result_data.get('original_word_count', 0)} → {result_data.get('new_word_count', 0)}"""
-            
-            return [types.TextContent(type="text", text=result)]
-        except Exception as e:
-            return [types.TextContent(type="text", text=f"Error improving content: {str(e)}")]
-    
-    elif name == "remove_emojis":
-        emoji_pattern = re.compile(
-            "["
-            "\U0001F600-\U0001F64F"
-            "\U0001F300-\U0001F5FF"
-            "\U0001F680-\U0001F6FF"
-            "\U0001F700-\U0001F77F"
-            "\U0001F780-\U0001F7FF"
-            "\U0001F800-\U0001F8FF"
-            "\U0001F900-\U0001F9FF"
-            "\U0001FA00-\U0001FA6F"
-            "\U0001FA70-\U0001FAFF"
-            "\U00002600-\U000026FF"
-            "\U00002700-\U000027BF"
-            "\U0001F1E0-\U0001F1FF"
-            "]+",
-            flags=re.UNICODE
-        )
-        
-        emojis = emoji_pattern.findall(content)
-        cleaned = emoji_pattern.sub('', content)
-        cleaned = re.sub(r'\s+', ' ', cleaned).strip()
-        
-        result = f"Cleaned Content:\n{cleaned}\n\nRemoved {len(emojis)} emoji(s)"
         
         return [types.TextContent(type="text", text=result)]
+    except Exception as e:
+        return [types.TextContent(type="text", text=f"Error improving content: {str(e)}")]
+
+async def _tool_remove_emojis(content: str, arguments: dict) -> list[types.TextContent]:
+    # No emoji is ASCII; otherwise one subn both removes and counts the runs
+    cleaned, removed = (content, 0) if content.isascii() else EMOJI_PATTERN.subn('', content)
+    cleaned = WHITESPACE_RUN.sub(' ', cleaned).strip()
     
-    elif name == "normalize_whitespace":
-        normalized = content
-        normalized = normalized.replace('\t', ' ')
-        normalized = re.sub(r' +', ' ', normalized)
-        normalized = re.sub(r'\n\n+', '\n\n', normalized)
-        normalized = normalized.replace('\r\n', '\n')
-        normalized = normalized.strip()
-        
-        chars_removed = len(content) - len(normalized)
-        
-        result = f"Normalized Content:\n{normalized}\n\nRemoved {chars_removed} extra whitespace character(s)"
-        
-        return [types.TextContent(type="text", text=result)]
+    result = f"Cleaned Content:\n{cleaned}\n\nRemoved {removed} emoji(s)"
     
-    else:
-        raise ValueError(f"Unknown tool: {name}")
+    return [types.TextContent(type="text", text=result)]
+
+async def _tool_normalize_whitespace(content: str, arguments: dict) -> list[types.TextContent]:
+    normalized = content
+    normalized = normalized.replace('\t', ' ')
+    if '  ' in normalized:
+        # Dropping the empty pieces between spaces collapses every run; the
+        # ends may lose a space too, but strip() below removes those anyway
+        normalized = ' '.join(filter(None, normalized.split(' ')))
+    # Each replace shortens every run of 3+ newlines by a third
+    while '\n\n\n' in normalized:
+        normalized = normalized.replace('\n\n\n', '\n\n')
+    normalized = normalized.replace('\r\n', '\n')
+    normalized = normalized.strip()
+    
+    chars_removed = len(content) - len(normalized)
+    
+    result = f"Normalized Content:\n{normalized}\n\nRemoved {chars_removed} extra whitespace character(s)"
+    
+    return [types.TextContent(type="text", text=result)]
+
+# One handler per tool, looked up by name instead of walking an elif chain
+_DISPATCH = {
+    "analyze_content_for_slop": _tool_analyze_content_for_slop,
+    "detect_ai_phrases": _tool_detect_ai_phrases,
+    "remove_filler_words": _tool_remove_filler_words,
+    "detect_cliches": _tool_detect_cliches,
+    "remove_hedging": _tool_remove_hedging,
+    "detect_passive_voice": _tool_detect_passive_voice,
+    "calculate_readability": _tool_calculate_readability,
+    "detect_repetition": _tool_detect_repetition,
+    "detect_run_on_sentences": _tool_detect_run_on_sentences,
+    "remove_redundancies": _tool_remove_redundancies,
+    "improve_content_from_slop": _tool_improve_content_from_slop,
+    "remove_emojis": _tool_remove_emojis,
+    "normalize_whitespace": _tool_normalize_whitespace,
+}
+
+@server.call_tool()
+async def handle_call_tool(
+    name: str, arguments: dict | None
+) -> list[types.TextContent | types.ImageContent | types.EmbeddedResource]:
+    
+    if not arguments:
+        raise ValueError("Missing arguments")
+    
+    content = arguments.get("content", "")
+    
+    try:
+        handler = _DISPATCH[name]
+    except KeyError:
+        raise ValueError(f"Unknown tool: {name}") from None
+    
+    return await handler(content, arguments)
 
 async def main():
     async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
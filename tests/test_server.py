@@ -0,0 +1,21 @@
+"""Regression tests for the standalone MCP server's tool handlers."""
+import asyncio
+
+import pytest
+
+pytest.importorskip("mcp")
+
+import server  # noqa: E402
+
+
+def call(name: str, content: str) -> str:
+    [result] = asyncio.run(server.handle_call_tool(name, {"content": content}))
+    return result.text
+
+
+def test_overlapping_passive_spans_count_once():
+    # 'was been' and 'been baked' overlap; the old separate -ed and -en
+    # patterns found both and reported 2
+    text = call("detect_passive_voice", "The cake was been baked.")
+    assert "Passive Sentences: 1 (100%)" in text
+    assert "Passive Phrases Found: 1" in text
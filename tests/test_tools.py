@@ -0,0 +1,298 @@
+"""Check each tool's data against the straightforward per-phrase logic it replaced."""
+import re
+
+import pytest
+
+pytest.importorskip("pydantic")
+
+from anti_slop import (  # noqa: E402
+    AIPhrasesAnalyzer,
+    ClicheAnalyzer,
+    EmojiCleaner,
+    FillerWordsCleaner,
+    HedgingCleaner,
+    PassiveVoiceAnalyzer,
+    ReadabilityAnalyzer,
+    RedundancyCleaner,
+    RepetitionAnalyzer,
+    RunOnSentenceAnalyzer,
+    WhitespaceCleaner,
+)
+
+EDGE_CASES = [
+    "",
+    "   \n\t ",
+    # Nested hedges, and hedges that overlap
+    "I think it might be possibly true, and it could potentially work... maybe.",
+    "It might possibly be. MIGHT POSSIBLY! It seems it seems, kind of sort of.",
+    # Self-overlapping clichés
+    "a win-win-win deal",
+    "win-win win-win-win-win, a WIN-WIN. Synergy synergy synergistic.",
+    # CRLF and lone CR
+    "First line.\r\nSecond line.\r\n\r\n\r\n\r\nThird\rline  with   spaces.\r",
+    "\r\n\r\n\r\n",
+    "one\r\rtwo\n\n\nthree \t four",
+    # Emoji runs
+    "Launch day 🚀🚀🔥 is here ✨! 😀 😀😀 done 🇺🇸",
+    "🎉🎉🎉",
+    # Overlapping passive spans
+    "The cake was been baked. It is known. Cookies were taken and eaten.",
+    "The cake was baked by Sam. The letter was written quickly. Is been opened? It is known.",
+    # Phrases sharing prefixes, and case-folding oddities
+    "Let's unpack this: it's worth noting that we delve into a deep-dive, "
+    "a game changer at the end of the day. Unpack, LEVERAGE, leveraging.",
+    "The past history of the FINAL OUTCOME is a true fact; the fınal outcome, juſt quıte.",
+    "Actually, basically... JUST very   really\tquite rather perhaps maybe.",
+    "word " * 40 + ". Short one! A b c d e f a b c d e f a b c.",
+]
+
+
+def count(phrase: str, content: str) -> int:
+    return len(re.findall(r'\b' + re.escape(phrase) + r'\b', content, re.IGNORECASE))
+
+
+def squash(text: str) -> str:
+    text = re.sub(r'\s+', ' ', text)
+    return re.sub(r'\s+([.,!?;:])', r'\1', text).strip()
+
+
+def sentences(content: str) -> list:
+    return [s.strip() for s in re.split(r'[.!?]+', content) if s.strip()]
+
+
+def ai_phrases(content: str) -> dict:
+    found = [
+        {"phrase": phrase, "count": count(phrase, content)}
+        for phrase in AIPhrasesAnalyzer.PHRASES
+        if count(phrase, content)
+    ]
+    return {"phrases_detected": len(found), "slop_score": min(10, len(found) * 2), "phrases": found}
+
+
+def cliches(content: str) -> dict:
+    found = [
+        {"cliche": cliche, "count": count(cliche, content)}
+        for cliche in ClicheAnalyzer.CLICHES
+        if count(cliche, content)
+    ]
+    return {
+        "cliches_detected": len(found),
+        "total_instances": sum(c["count"] for c in found),
+        "cliches": found,
+    }
+
+
+def passive_voice(content: str) -> dict:
+    # One pattern for both endings: a span like 'was been' is counted once,
+    # where two separate -ed and -en patterns could count overlapping spans
+    pattern = re.compile(r'\b(is|are|was|were|be|been|being)\s+\w+(ed|en)\b', re.IGNORECASE)
+    all_sentences = sentences(content)
+    passive = [s for s in all_sentences if pattern.search(s)]
+    return {
+        "total_sentences": len(all_sentences),
+        "passive_sentences": len(passive),
+        "passive_percentage": round(len(passive) / len(all_sentences) * 100) if all_sentences else 0,
+        "passive_phrases_found": len(pattern.findall(content)),
+    }
+
+
+def syllables(word: str) -> int:
+    word = re.sub(r'[^a-z]', '', word.lower())
+    if len(word) <= 3:
+        return 1
+    word = re.sub(r'(?:[^laeiouy]es|ed|[^laeiouy]e)$', '', word)
+    word = re.sub(r'^y', '', word)
+    return len(re.findall(r'[aeiouy]{1,2}', word)) or 1
+
+
+def readability(content: str) -> dict:
+    sentence_count = len(sentences(content))
+    words = content.split()
+    syllable_count = sum(syllables(word) for word in words)
+    avg_sentence_length = len(words) / sentence_count if sentence_count else 0
+    avg_syllables = syllable_count / len(words) if words else 0
+    flesch = max(0, min(100, 206.835 - 1.015 * avg_sentence_length - 84.6 * avg_syllables))
+    grade = max(0, 0.39 * avg_sentence_length + 11.8 * avg_syllables - 15.59)
+    difficulty = next(
+        label for threshold, label in [
+            (90, 'Very Easy'), (80, 'Easy'), (70, 'Fairly Easy'), (60, 'Standard'),
+            (50, 'Fairly Difficult'), (30, 'Difficult'), (float('-inf'), 'Very Difficult'),
+        ]
+        if flesch >= threshold
+    )
+    return {
+        "stats": {
+            "sentences": sentence_count,
+            "words": len(words),
+            "syllables": syllable_count,
+            "avg_sentence_length": round(avg_sentence_length, 1),
+            "avg_syllables_per_word": round(avg_syllables, 1),
+        },
+        "readability": {
+            "flesch_reading_ease": round(flesch),
+            "grade_level": round(grade, 1),
+            "difficulty": difficulty,
+        },
+    }
+
+
+def repetition(content: str, min_length: int = 3) -> dict:
+    words = content.lower().split()
+    phrases = {}
+    # A min_length below 1 counts as 1, rather than reporting an empty phrase
+    for length in range(max(min_length, 1), 6):
+        for i in range(len(words) - length + 1):
+            phrase = ' '.join(words[i:i + length])
+            phrases[phrase] = phrases.get(phrase, 0) + 1
+    repeated = [{"phrase": p, "count": c} for p, c in phrases.items() if c > 1]
+    repeated.sort(key=lambda item: item["count"], reverse=True)
+    repeated = repeated[:20]
+    return {
+        "repeated_phrases": len(repeated),
+        "phrases": repeated,
+        "repetition_score": min(10, len(repeated) // 2),
+    }
+
+
+def run_on_sentences(content: str, max_words: int = 30) -> dict:
+    all_sentences = sentences(content)
+    long_sentences = [
+        {
+            "sentence": s[:100] + "..." if len(s) > 100 else s,
+            "word_count": len(s.split()),
+        }
+        for s in all_sentences
+        if len(s.split()) > max_words
+    ]
+    return {
+        "total_sentences": len(all_sentences),
+        "run_on_sentences": len(long_sentences),
+        "percentage": round(len(long_sentences) / len(all_sentences) * 100) if all_sentences else 0,
+        "sentences": long_sentences,
+    }
+
+
+def remove_phrases(content: str, phrases) -> tuple:
+    found = {}
+    cleaned = content
+    for phrase in phrases:
+        pattern = re.compile(r'\b' + re.escape(phrase) + r'\b', re.IGNORECASE)
+        matches = pattern.findall(content)
+        if matches:
+            found[phrase] = len(matches)
+            cleaned = pattern.sub('', cleaned)
+    return found, squash(cleaned)
+
+
+def filler_words(content: str) -> dict:
+    found, cleaned = remove_phrases(content, FillerWordsCleaner.FILLER_WORDS)
+    return {
+        "original_content": content,
+        "cleaned_content": cleaned,
+        "filler_words_removed": sum(found.values()),
+        "breakdown": found,
+    }
+
+
+def hedging(content: str) -> dict:
+    found, cleaned = remove_phrases(content, HedgingCleaner.HEDGE_PHRASES)
+    return {
+        "original_content": content,
+        "cleaned_content": cleaned,
+        "hedging_removed": sum(found.values()),
+        "breakdown": found,
+    }
+
+
+def redundancies(content: str) -> dict:
+    found = []
+    cleaned = content
+    for item in RedundancyCleaner.REDUNDANCIES:
+        pattern = re.compile(r'\b' + re.escape(item['phrase']) + r'\b', re.IGNORECASE)
+        matches = pattern.findall(content)
+        if matches:
+            found.append({**item, "count": len(matches)})
+            cleaned = pattern.sub(item['replacement'], cleaned)
+    return {
+        "original_content": content,
+        "cleaned_content": cleaned,
+        "redundancies_removed": len(found),
+        "changes": found,
+    }
+
+
+def emojis(content: str) -> dict:
+    pattern = EmojiCleaner.EMOJI_PATTERN
+    return {
+        "original_content": content,
+        "cleaned_content": re.sub(r'\s+', ' ', pattern.sub('', content)).strip(),
+        "emojis_removed": len(pattern.findall(content)),
+        "emojis_found": pattern.findall(content),
+    }
+
+
+def whitespace(content: str) -> dict:
+    normalized = content.replace('\t', ' ')
+    normalized = re.sub(r' +', ' ', normalized)
+    normalized = re.sub(r'\n\n+', '\n\n', normalized)
+    normalized = normalized.replace('\r\n', '\n').strip()
+    return {
+        "original_content": content,
+        "normalized_content": normalized,
+        "characters_removed": len(content) - len(normalized),
+    }
+
+
+REFERENCES = [
+    (AIPhrasesAnalyzer, ai_phrases),
+    (ClicheAnalyzer, cliches),
+    (PassiveVoiceAnalyzer, passive_voice),
+    (ReadabilityAnalyzer, readability),
+    (RepetitionAnalyzer, repetition),
+    (RunOnSentenceAnalyzer, run_on_sentences),
+    (FillerWordsCleaner, filler_words),
+    (HedgingCleaner, hedging),
+    (RedundancyCleaner, redundancies),
+    (EmojiCleaner, emojis),
+    (WhitespaceCleaner, whitespace),
+]
+
+
+@pytest.mark.parametrize("content", EDGE_CASES)
+@pytest.mark.parametrize("tool_class, reference", REFERENCES, ids=lambda r: getattr(r, "__name__", None))
+def test_tool_matches_reference(tool_class, reference, content):
+    result = tool_class().execute(content)
+    assert result.success
+    assert result.data == reference(content)
+
+
+@pytest.mark.parametrize("min_length", [-2, 0, 1, 2, 3, 5, 6])
+@pytest.mark.parametrize("content", EDGE_CASES)
+def test_repetition_min_length(content, min_length):
+    result = RepetitionAnalyzer().execute(content, min_length=min_length)
+    assert result.data == repetition(content, min_length)
+
+
+@pytest.mark.parametrize("max_words", [0, 1, 5])
+@pytest.mark.parametrize("content", EDGE_CASES)
+def test_run_on_max_words(content, max_words):
+    result = RunOnSentenceAnalyzer().execute(content, max_words=max_words)
+    assert result.data == run_on_sentences(content, max_words)
+
+
+def test_nested_hedges_are_counted():
+    data = HedgingCleaner().execute("It might possibly be.").data
+    assert data["breakdown"] == {'might': 1, 'possibly': 1, 'might possibly': 1}
+
+
+def test_self_overlapping_cliche_counts_once():
+    data = ClicheAnalyzer().execute("a win-win-win deal").data
+    assert data["cliches"] == [{"cliche": "win-win", "count": 1}]
+
+
+def test_overlapping_passive_spans_count_once():
+    # 'was been' and 'been baked' overlap; the old separate -ed and -en
+    # patterns found both and reported 2
+    data = PassiveVoiceAnalyzer().execute("The cake was been baked.").data
+    assert data["passive_phrases_found"] == 1
+    assert data["passive_sentences"] == 1